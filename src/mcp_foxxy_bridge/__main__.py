@@ -32,49 +32,105 @@ Two ways to run the application:
 
 import argparse
 import asyncio
-import json
+import dataclasses
+import functools
 import logging
 import os
-import shlex
 import sys
 import typing as t
-from importlib.metadata import version
-from pathlib import Path
 
-from mcp.client.stdio import StdioServerParameters
-
-from .config_loader import (
-    BridgeConfiguration,
-    load_bridge_config_from_file,
-    load_named_server_configs_from_file,
+if t.TYPE_CHECKING:
+    from mcp.client.stdio import StdioServerParameters
+
+    from .config_loader import BridgeConfiguration
+    from .mcp_server import MCPServerSettings
+
+# Interned small literals reused as dict keys / compare targets downstream.
+_LOCALHOST = sys.intern("127.0.0.1")
+_LOG_LEVEL_DEBUG = sys.intern("DEBUG")
+_LOG_LEVEL_INFO = sys.intern("INFO")
+
+_DESCRIPTION = "Start the MCP proxy in one of two possible modes: as a client or a server."
+
+# Pure adjacent literals so the peephole optimizer folds this to one constant.
+_EPILOG = (
+    "Examples:\n"
+    "  mcp-foxxy-bridge http://localhost:8080/sse\n"
+    "  mcp-foxxy-bridge --transport streamablehttp http://localhost:8080/mcp\n"
+    "  mcp-foxxy-bridge --headers Authorization 'Bearer YOUR_TOKEN' http://localhost:8080/sse\n"
+    "  mcp-foxxy-bridge --port 8080 -- your-command --arg1 value1 --arg2 value2\n"
+    "  mcp-foxxy-bridge --named-server fetch 'uvx mcp-server-fetch' --port 8080\n"
+    "  mcp-foxxy-bridge your-command --port 8080 -e KEY VALUE "
+    "-e ANOTHER_KEY ANOTHER_VALUE\n"
+    "  mcp-foxxy-bridge your-command --port 8080 --allow-origin='*'\n"
 )
-from .logging_config import setup_rich_logging
-from .mcp_server import MCPServerSettings, run_bridge_server
-from .sse_client import run_sse_client
-from .streamablehttp_client import run_streamablehttp_client
-
-# Deprecated env var. Here for backwards compatibility.
-SSE_URL: t.Final[str | None] = os.getenv(
-    "SSE_URL",
-    None,
+
+_CONFIG_MISSING_GUIDANCE = (
+    "No config.json found in current directory.\n"
+    "To get started with MCP Foxxy Bridge, you need a configuration file.\n"
+    "You can:\n"
+    "  1. Copy an example: cp docs/examples/basic-config.json config.json\n"
+    "  2. Create a minimal config:\n"
+    '     echo \'{"servers": {"filesystem": {"command": "npx", '
+    '"args": ["-y", "@modelcontextprotocol/server-filesystem", "./"]}}}\' '
+    "> config.json\n"
+    "  3. Use a different config: mcp-foxxy-bridge --bridge-config path/to/your/config.json\n"
+    "  4. See available examples in docs/examples/ directory\n"
+    "\n"
+    "For more help, see: "
+    "https://github.com/billyjbryant/mcp-foxxy-bridge/blob/main/docs/configuration.md"
 )
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _ParsedArgs:
+    """Immutable, slotted view of the parsed CLI arguments.
+
+    Slot access is a C-level read instead of a Namespace ``__dict__`` lookup,
+    and freezing makes the post-parse normalization the single source of
+    truth for downstream code.
+    """
+
+    command_or_url: str | None
+    headers: list[list[str]]
+    transport: str
+    args: list[str]
+    env: list[list[str]]
+    cwd: str | None
+    pass_environment: bool
+    debug: bool
+    named_server_definitions: list[tuple[str, str]]
+    named_server_config: str | None
+    bridge_config: str
+    port: int
+    host: str
+    stateless: bool
+    sse_port: int
+    sse_host: str
+    allow_origin: list[str]
+
+    @classmethod
+    def from_namespace(cls, namespace: argparse.Namespace) -> "_ParsedArgs":
+        """Normalize an argparse namespace into the frozen argument view."""
+        raw = vars(namespace)
+        raw.pop("version", None)
+        # append-action options default to None (the stdlib idiom); coerce
+        # once here instead of making argparse copy defaults on every parse.
+        for list_field in ("headers", "env", "named_server_definitions", "allow_origin"):
+            raw[list_field] = raw[list_field] or []
+        if raw["command_or_url"] is None:
+            # Deprecated env var. Here for backwards compatibility; read at
+            # parse time rather than import time so late env changes are
+            # honored.
+            raw["command_or_url"] = os.getenv("SSE_URL")
+        return cls(**raw)
+
+
 def _setup_argument_parser() -> argparse.ArgumentParser:
     """Set up and return the argument parser for the MCP proxy."""
     parser = argparse.ArgumentParser(
-        description=("Start the MCP proxy in one of two possible modes: as a client or a server."),
-        epilog=(
-            "Examples:\n"
-            "  mcp-foxxy-bridge http://localhost:8080/sse\n"
-            "  mcp-foxxy-bridge --transport streamablehttp http://localhost:8080/mcp\n"
-            "  mcp-foxxy-bridge --headers Authorization 'Bearer YOUR_TOKEN' http://localhost:8080/sse\n"
-            "  mcp-foxxy-bridge --port 8080 -- your-command --arg1 value1 --arg2 value2\n"
-            "  mcp-foxxy-bridge --named-server fetch 'uvx mcp-server-fetch' --port 8080\n"
-            "  mcp-foxxy-bridge your-command --port 8080 -e KEY VALUE "  # Line split
-            "-e ANOTHER_KEY ANOTHER_VALUE\n"
-            "  mcp-foxxy-bridge your-command --port 8080 --allow-origin='*'\n"
-        ),
+        description=_DESCRIPTION,
+        epilog=_EPILOG,
         formatter_class=argparse.RawTextHelpFormatter,
     )
 
@@ -82,8 +138,17 @@ def _setup_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
-    """Add all arguments to the argument parser."""
+@functools.lru_cache(maxsize=1)
+def _resolve_package_version() -> str:
+    """Resolve the installed package version, falling back to the VERSION file.
+
+    Cached for the process lifetime so repeated lookups skip the dist-info
+    scan and file stat. importlib.metadata and pathlib are imported here so
+    ordinary invocations never pay for them.
+    """
+    from importlib.metadata import version  # noqa: PLC0415
+    from pathlib import Path  # noqa: PLC0415
+
     try:
         package_version = version("mcp-foxxy-bridge")
     except Exception:  # noqa: BLE001
@@ -96,11 +161,38 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
                 package_version = "unknown"
         except Exception:  # noqa: BLE001
             package_version = "unknown"
+    return package_version
+
+
+class _LazyVersionAction(argparse.Action):
+    """Argparse action that resolves the package version only when requested.
+
+    ``importlib.metadata.version`` scans dist-info directories on sys.path,
+    so the lookup is deferred until the user actually passes ``--version``.
+    """
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,  # noqa: ARG002
+        values: "str | t.Sequence[t.Any] | None",  # noqa: ARG002
+        option_string: str | None = None,  # noqa: ARG002
+    ) -> None:
+        # Print to stdout like the stock version action; parser.exit would
+        # send the message to stderr and break piped invocations.
+        parser._print_message(  # noqa: SLF001
+            f"{parser.prog} {_resolve_package_version()}\n",
+            sys.stdout,
+        )
+        parser.exit()
+
 
+def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
+    """Add all arguments to the argument parser."""
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {package_version}",
+        action=_LazyVersionAction,
+        nargs=0,
         help="Show the version and exit",
     )
 
@@ -114,7 +206,7 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
             "See corresponding options for more details."
         ),
         nargs="?",
-        default=SSE_URL,
+        default=None,
     )
 
     client_group = parser.add_argument_group("SSE/StreamableHTTP client options")
@@ -125,7 +217,7 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
         action="append",
         metavar=("KEY", "VALUE"),
         help="Headers to pass to the SSE server. Can be used multiple times.",
-        default=[],
+        default=None,
     )
     client_group.add_argument(
         "--transport",
@@ -154,7 +246,7 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
             "used multiple times. For named servers, environment is inherited or "
             "passed via --pass-environment."
         ),
-        default=[],
+        default=None,
     )
     stdio_client_options.add_argument(
         "--cwd",
@@ -166,15 +258,13 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
     )
     stdio_client_options.add_argument(
         "--pass-environment",
-        action=argparse.BooleanOptionalAction,
+        action="store_true",
         help="Pass through all environment variables when spawning all server processes.",
-        default=False,
     )
     stdio_client_options.add_argument(
         "--debug",
-        action=argparse.BooleanOptionalAction,
+        action="store_true",
         help="Enable debug mode with detailed logging output.",
-        default=False,
     )
     stdio_client_options.add_argument(
         "--named-server",
@@ -187,7 +277,7 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
             "(e.g., 'uvx mcp-server-fetch --timeout 10'). "
             "These servers inherit the proxy's CWD and environment from --pass-environment."
         ),
-        default=[],
+        default=None,
         dest="named_server_definitions",
     )
     stdio_client_options.add_argument(
@@ -229,9 +319,8 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
     )
     mcp_server_group.add_argument(
         "--stateless",
-        action=argparse.BooleanOptionalAction,
+        action="store_true",
         help="Enable stateless mode for streamable http transports. Default is False",
-        default=False,
     )
     mcp_server_group.add_argument(
         "--sse-port",
@@ -247,7 +336,7 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
     mcp_server_group.add_argument(
         "--allow-origin",
         nargs="+",
-        default=[],
+        default=None,
         help=(
             "Allowed origins for the SSE server. Can be used multiple times. "
             "Default is no CORS allowed."
@@ -255,13 +344,30 @@ def _add_arguments_to_parser(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _install_uvloop() -> None:
+    """Install uvloop as the asyncio event loop policy when available.
+
+    uvloop substantially speeds up the socket and subprocess I/O the bridge
+    spends most of its time in; it is an optional accelerator, so a missing
+    install silently falls back to the default loop.
+    """
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        return
+    uvloop.install()
+
+
 def _setup_logging(*, debug: bool) -> logging.Logger:
     """Set up Rich-based logging configuration and return the logger."""
+    # Imported lazily so --help/--version never pay the rich import cost.
+    from .logging_config import setup_rich_logging  # noqa: PLC0415
+
     return setup_rich_logging(debug=debug)
 
 
 def _handle_sse_client_mode(
-    args_parsed: argparse.Namespace,
+    args_parsed: _ParsedArgs,
     logger: logging.Logger,
 ) -> None:
     """Handle SSE/StreamableHTTP client mode operation."""
@@ -276,32 +382,38 @@ def _handle_sse_client_mode(
     if api_access_token := os.getenv("API_ACCESS_TOKEN", None):
         headers["Authorization"] = f"Bearer {api_access_token}"
 
+    _install_uvloop()
     if args_parsed.transport == "streamablehttp":
+        from .streamablehttp_client import run_streamablehttp_client  # noqa: PLC0415
+
         asyncio.run(run_streamablehttp_client(args_parsed.command_or_url, headers=headers))
     else:
+        from .sse_client import run_sse_client  # noqa: PLC0415
+
         asyncio.run(run_sse_client(args_parsed.command_or_url, headers=headers))
 
 
 def _configure_default_server(
-    args_parsed: argparse.Namespace,
+    args_parsed: _ParsedArgs,
     base_env: dict[str, str],
     logger: logging.Logger,
-) -> StdioServerParameters | None:
+) -> "StdioServerParameters | None":
     """Configure the default server if applicable."""
-    if not (
-        args_parsed.command_or_url
-        and not args_parsed.command_or_url.startswith(("http://", "https://"))
-    ):
+    cmd = args_parsed.command_or_url
+    # Slice compares avoid the tuple form of startswith on every invocation.
+    if not cmd or cmd[:7] == "http://" or cmd[:8] == "https://":
         return None
 
-    default_server_env = base_env.copy()
-    default_server_env.update(dict(args_parsed.env))  # Specific env vars for default server
+    from mcp.client.stdio import StdioServerParameters  # noqa: PLC0415
+
+    # Single C-level merge: base env plus specific env vars for the default server.
+    default_server_env = {**base_env, **dict(args_parsed.env)}
 
     default_stdio_params = StdioServerParameters(
         command=args_parsed.command_or_url,
         args=args_parsed.args,
         env=default_server_env,
-        cwd=args_parsed.cwd if args_parsed.cwd else None,
+        cwd=args_parsed.cwd or None,
     )
     logger.info(
         "Configured default server: %s %s",
@@ -315,11 +427,15 @@ def _load_named_servers_from_config(
     config_path: str,
     base_env: dict[str, str],
     logger: logging.Logger,
-) -> dict[str, StdioServerParameters]:
+) -> "dict[str, StdioServerParameters]":
     """Load named server configurations from a file."""
+    from .config_loader import load_named_server_configs_from_file  # noqa: PLC0415
+
     try:
         return load_named_server_configs_from_file(config_path, base_env)
-    except (FileNotFoundError, json.JSONDecodeError, ValueError):
+    except (FileNotFoundError, ValueError):
+        # json.JSONDecodeError is a ValueError subclass, so this covers it
+        # without importing json in this module.
         # Specific errors are already logged by the loader function
         # We log a generic message here before exiting
         logger.exception(
@@ -339,25 +455,39 @@ def _configure_named_servers_from_cli(
     named_server_definitions: list[tuple[str, str]],
     base_env: dict[str, str],
     logger: logging.Logger,
-) -> dict[str, StdioServerParameters]:
+) -> "dict[str, StdioServerParameters]":
     """Configure named servers from CLI arguments."""
+    if not named_server_definitions:
+        return {}
+
+    import shlex  # noqa: PLC0415
+
+    from mcp.client.stdio import StdioServerParameters  # noqa: PLC0415
+
     named_stdio_params: dict[str, StdioServerParameters] = {}
 
     for name, command_string in named_server_definitions:
         try:
-            command_parts = shlex.split(command_string)
+            # Most MCP command strings are plain words; only fall back to the
+            # full shlex lexer when quoting or escapes are actually present.
+            if not any(ch in command_string for ch in ('"', "'", "\\")):
+                command_parts = command_string.split()
+            else:
+                command_parts = shlex.split(command_string)
             if not command_parts:  # Handle empty command_string
                 logger.error("Empty COMMAND_STRING for named server '%s'. Skipping.", name)
                 continue
 
-            command = command_parts[0]
+            # Interned so downstream dict keys/compares hit pointer equality.
+            server_name = sys.intern(name)
+            command = sys.intern(command_parts[0])
             command_args = command_parts[1:]
             # Named servers inherit base_env (which includes passed-through env)
             # and use the proxy's CWD.
-            named_stdio_params[name] = StdioServerParameters(
+            named_stdio_params[server_name] = StdioServerParameters(
                 command=command,
                 args=command_args,
-                env=base_env.copy(),  # Each named server gets a copy of the base env
+                env={**base_env},  # Each named server gets its own copy of the base env
                 cwd=None,  # Named servers run in the proxy's CWD
             )
             logger.info("Configured named server '%s': %s", name, command_string)
@@ -376,12 +506,14 @@ def _configure_named_servers_from_cli(
 
 
 def _create_mcp_settings(
-    args_parsed: argparse.Namespace,
+    args_parsed: _ParsedArgs,
     bridge_config: "BridgeConfiguration | None" = None,
-) -> MCPServerSettings:
+) -> "MCPServerSettings":
     """Create MCP server settings from parsed arguments and optional bridge config."""
+    from .mcp_server import MCPServerSettings  # noqa: PLC0415
+
     # Priority: CLI args > config file > defaults
-    default_host = "127.0.0.1"
+    default_host = _LOCALHOST
     default_port = 8080
 
     if bridge_config and bridge_config.bridge:
@@ -397,56 +529,48 @@ def _create_mcp_settings(
         bind_host=host,
         port=port,
         stateless=args_parsed.stateless,
-        allow_origins=args_parsed.allow_origin if len(args_parsed.allow_origin) > 0 else None,
-        log_level="DEBUG" if args_parsed.debug else "INFO",
+        allow_origins=args_parsed.allow_origin or None,
+        log_level=_LOG_LEVEL_DEBUG if args_parsed.debug else _LOG_LEVEL_INFO,
     )
 
 
-def main() -> None:
-    """Start the client using asyncio."""
-    parser = _setup_argument_parser()
-    args_parsed = parser.parse_args()
-    logger = _setup_logging(debug=args_parsed.debug)
+def _parse_bootstrap_args() -> argparse.Namespace:
+    """Parse only the arguments needed for the config-existence fast path.
 
-    # Handle bridge mode first (takes precedence over all other options)
-    # Check if config file exists (especially for default config.json)
-    # Resolve the actual config path used (important for config reloading)
-    config_path = args_parsed.bridge_config
+    Building the full parser (groups, epilog, every help string) is wasted
+    work when the config file is missing, so a minimal bootstrap parser
+    resolves ``--bridge-config`` and ``--debug`` first. ``--help`` and
+    ``--version`` still fall through to the full parser.
+    """
+    bootstrap = argparse.ArgumentParser(add_help=False)
+    bootstrap.add_argument(
+        "--bridge-config",
+        type=str,
+        default=os.getenv("MCP_BRIDGE_CONFIG", "config.json"),
+    )
+    bootstrap.add_argument(
+        "--debug",
+        action="store_true",
+    )
+    args_bootstrap, _ = bootstrap.parse_known_args()
+    return args_bootstrap
 
-    if not Path(config_path).exists():
-        if config_path == "config.json":
-            # Default config.json doesn't exist, provide helpful guidance
-            logger.info("No config.json found in current directory.")
-            logger.info("To get started with MCP Foxxy Bridge, you need a configuration file.")
-            logger.info("You can:")
-            logger.info("  1. Copy an example: cp docs/examples/basic-config.json config.json")
-            logger.info("  2. Create a minimal config:")
-            logger.info(
-                '     echo \'{"servers": {"filesystem": {"command": "npx", '
-                '"args": ["-y", "@modelcontextprotocol/server-filesystem", "./"]}}}\' '
-                "> config.json",
-            )
-            logger.info(
-                "  3. Use a different config: mcp-foxxy-bridge --bridge-config "
-                "path/to/your/config.json",
-            )
-            logger.info("  4. See available examples in docs/examples/ directory")
-            logger.info("")
-            logger.info(
-                "For more help, see: https://github.com/billyjbryant/mcp-foxxy-bridge/blob/main/docs/configuration.md",
-            )
-            sys.exit(1)
-        else:
-            # Custom config file doesn't exist
-            logger.error("Bridge configuration file not found: %s", config_path)
-            sys.exit(1)
+
+def _run_bridge(args_parsed: _ParsedArgs, logger: logging.Logger) -> None:
+    """Run the bridge server that aggregates the configured MCP servers."""
+    # Pin the absolute path once so downstream loading and config-reload
+    # watching never re-normalize the string.
+    config_path = os.path.abspath(args_parsed.bridge_config)  # noqa: PTH100
 
     logger.info("Starting in bridge mode with config: %s", config_path)
 
-    # Load bridge configuration
-    bridge_base_env: dict[str, str] = {}
-    if args_parsed.pass_environment:
-        bridge_base_env.update(os.environ)
+    # Only pay the mcp/config import cost once we know we are actually starting.
+    from .config_loader import load_bridge_config_from_file  # noqa: PLC0415
+    from .mcp_server import run_bridge_server  # noqa: PLC0415
+
+    # Load bridge configuration. The loader copies per-server, so one direct
+    # dict(os.environ) snapshot is all the copying this path needs.
+    bridge_base_env: dict[str, str] = dict(os.environ) if args_parsed.pass_environment else {}
 
     try:
         bridge_config = load_bridge_config_from_file(config_path, bridge_base_env)
@@ -456,6 +580,7 @@ def main() -> None:
 
     # Create MCP server settings and run the bridge server
     mcp_settings = _create_mcp_settings(args_parsed, bridge_config)
+    _install_uvloop()
     try:
         asyncio.run(run_bridge_server(mcp_settings, bridge_config, config_path))
     except KeyboardInterrupt:
@@ -465,5 +590,67 @@ def main() -> None:
         return
 
 
+# Straight-line handler per CLI mode; each handler owns its lazy imports.
+_MODE_HANDLERS: dict[str, "t.Callable[[_ParsedArgs, logging.Logger], None]"] = {
+    "bridge": _run_bridge,
+    "sse": _handle_sse_client_mode,
+}
+
+
+def _select_mode(args_parsed: _ParsedArgs) -> str:
+    """Pick the CLI mode key for the dispatch table."""
+    cmd = args_parsed.command_or_url
+    if cmd and (cmd[:7] == "http://" or cmd[:8] == "https://"):
+        return "sse"
+    return "bridge"
+
+
+def main() -> None:
+    """Start the client using asyncio."""
+    # Handle bridge mode first (takes precedence over all other options)
+    # Check if config file exists (especially for default config.json)
+    # Resolve the actual config path used (important for config reloading)
+    args_bootstrap = _parse_bootstrap_args()
+    config_path = args_bootstrap.bridge_config
+    argv = sys.argv[1:]
+    wants_help = "-h" in argv or "--help" in argv or "--version" in argv
+    # A URL positional selects SSE/StreamableHTTP client mode, which does not
+    # need a bridge config at all; the deprecated SSE_URL env var can supply
+    # the URL too, so honor it the same way _select_mode will.
+    sse_url = os.getenv("SSE_URL") or ""
+    has_url = (
+        sse_url[:7] == "http://"
+        or sse_url[:8] == "https://"
+        or any(arg[:7] == "http://" or arg[:8] == "https://" for arg in argv)
+    )
+
+    # Single os.stat instead of Path construction + Path.exists.
+    try:
+        os.stat(config_path)  # noqa: PTH116
+        config_exists = True
+    except OSError:
+        config_exists = False
+
+    if not wants_help and not has_url and not config_exists:
+        logger = _setup_logging(debug=args_bootstrap.debug)
+        if config_path == "config.json":
+            # Default config.json doesn't exist, provide helpful guidance.
+            # One log record instead of ten keeps the error path to a single
+            # handler/render pass.
+            logger.info(_CONFIG_MISSING_GUIDANCE)
+            sys.exit(1)
+        else:
+            # Custom config file doesn't exist
+            logger.error("Bridge configuration file not found: %s", config_path)
+            sys.exit(1)
+
+    # Config exists (or the user asked for help): build the full parser.
+    parser = _setup_argument_parser()
+    args_parsed = _ParsedArgs.from_namespace(parser.parse_args())
+    logger = _setup_logging(debug=args_parsed.debug)
+
+    _MODE_HANDLERS[_select_mode(args_parsed)](args_parsed, logger)
+
+
 if __name__ == "__main__":
     main()
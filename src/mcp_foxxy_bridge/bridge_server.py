@@ -23,7 +23,10 @@ a unified interface for AI tools to interact with all of them.
 """
 
 import asyncio
+import functools
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from mcp import server, types
@@ -34,8 +37,361 @@ from .server_manager import ServerManager
 
 logger = logging.getLogger(__name__)
 
-# Registry to store server manager instances for proper cleanup
-_server_manager_registry: dict[Any, ServerManager] = {}
+# Each bridge app carries its ServerManager on this private attribute instead
+# of a module-level registry, so manager lifetime tracks the app directly and
+# concurrent bridge creation never touches shared mutable state.
+_MANAGER_ATTR = "_foxxy_server_manager"
+
+
+def _attach_server_manager(app: server.Server[object], server_manager: ServerManager) -> None:
+    setattr(app, _MANAGER_ATTR, server_manager)
+
+
+def _register_background_task(app: server.Server[object], task: asyncio.Task[None]) -> None:
+    """Track a background task on the app so it is neither GC'd nor leaked.
+
+    Tasks are kept in ``app.background_tasks`` and remove themselves on
+    completion; shutdown_bridge_server cancels whatever is still pending.
+    """
+    tasks: set[asyncio.Task[None]] | None = getattr(app, "background_tasks", None)
+    if tasks is None:
+        tasks = set()
+        app.background_tasks = tasks  # type: ignore[attr-defined]
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+
+
+def get_server_manager(app: server.Server[object] | None) -> ServerManager | None:
+    """Return the ServerManager attached to a bridge app, if any."""
+    if app is None:
+        return None
+    return getattr(app, _MANAGER_ATTR, None)
+
+
+# Clients poll list_tools/list_prompts/list_resources aggressively (often
+# before every LLM call), so aggregated lists are cached briefly instead of
+# being rebuilt per request.
+_AGGREGATE_CACHE_TTL_SECONDS = 30.0
+
+
+class _AggregateCache:
+    """TTL cache for aggregated capability lists, keyed per server manager.
+
+    Entries are validated against both a monotonic-clock expiry and the
+    manager's capability cache version, so backend connects/disconnects
+    invalidate immediately while steady-state polling hits the cache.
+    """
+
+    def __init__(self, ttl_seconds: float = _AGGREGATE_CACHE_TTL_SECONDS) -> None:
+        self._ttl = ttl_seconds
+        self._entries: dict[tuple[int, str], tuple[float, int, list[Any]]] = {}
+
+    def get(self, server_manager: ServerManager, category: str) -> list[Any] | None:
+        """Return the cached list for this manager/category, or None if stale."""
+        entry = self._entries.get((id(server_manager), category))
+        if entry is None:
+            return None
+        expiry, version, value = entry
+        if time.monotonic() >= expiry or version != server_manager.capability_cache_version:
+            return None
+        return value
+
+    def put(self, server_manager: ServerManager, category: str, value: list[Any]) -> None:
+        """Store an aggregated list for this manager/category."""
+        self._entries[(id(server_manager), category)] = (
+            time.monotonic() + self._ttl,
+            server_manager.capability_cache_version,
+            value,
+        )
+
+    def discard(self, server_manager: ServerManager) -> None:
+        """Drop all entries for a manager (called on bridge shutdown)."""
+        manager_id = id(server_manager)
+        for key in [key for key in self._entries if key[0] == manager_id]:
+            del self._entries[key]
+
+
+_aggregate_cache = _AggregateCache()
+
+# MCP logging levels (already lowercase Literal values on the wire) mapped to
+# stdlib levels, so _set_logging_level does a single dict lookup with no string
+# normalization. Syslog-style levels without a stdlib equivalent map to the
+# nearest stdlib severity.
+_LEVEL_MAP: dict[types.LoggingLevel, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "notice": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "alert": logging.CRITICAL,
+    "emergency": logging.CRITICAL,
+}
+
+# Shared empty fallback results for the list-handler error paths. Handlers only
+# serialize these, never mutate them, so one instance per category is safe and
+# error storms from a failing backend stop allocating fresh result objects.
+_EMPTY_PROMPTS_RESULT = types.ServerResult(types.ListPromptsResult(prompts=[]))
+_EMPTY_RESOURCES_RESULT = types.ServerResult(types.ListResourcesResult(resources=[]))
+_EMPTY_TOOLS_RESULT = types.ServerResult(types.ListToolsResult(tools=[]))
+
+# Static error payload for the _get_prompt fallback; the surrounding result
+# still carries the per-request prompt name in its description.
+_ERROR_PROMPT_MESSAGE = types.PromptMessage(
+    role="user",
+    content=types.TextContent(
+        type="text",
+        text="Error occurred while retrieving prompt",
+    ),
+)
+
+
+# Request handlers are module-level coroutines bound to a ServerManager with
+# functools.partial at registration time. This avoids allocating a fresh set of
+# closures for every bridge created (tag-filtered mode creates many).
+
+
+async def _list_prompts(
+    server_manager: ServerManager,
+    _: types.ListPromptsRequest,
+) -> types.ServerResult:
+    try:
+        prompts = _aggregate_cache.get(server_manager, "prompts")
+        if prompts is None:
+            prompts = server_manager.get_aggregated_prompts()
+            _aggregate_cache.put(server_manager, "prompts", prompts)
+        result = types.ListPromptsResult(prompts=prompts)
+        return types.ServerResult(result)
+    except Exception:
+        logger.exception("Error listing prompts")
+        return _EMPTY_PROMPTS_RESULT
+
+
+async def _get_prompt(
+    server_manager: ServerManager,
+    req: types.GetPromptRequest,
+) -> types.ServerResult:
+    try:
+        result = await server_manager.get_prompt(
+            req.params.name,
+            req.params.arguments,
+        )
+        return types.ServerResult(result)
+    except McpError as e:
+        # Re-raise MCP errors so they're properly returned to the client
+        logger.warning("MCP error getting prompt '%s': %s", req.params.name, e.error.message)
+        raise
+    except Exception:
+        logger.exception("Error getting prompt '%s'", req.params.name)
+        return types.ServerResult(
+            types.GetPromptResult(
+                description=f"Error retrieving prompt: {req.params.name}",
+                messages=[_ERROR_PROMPT_MESSAGE],
+            ),
+        )
+
+
+async def _list_resources(
+    server_manager: ServerManager,
+    _: types.ListResourcesRequest,
+) -> types.ServerResult:
+    try:
+        resources = _aggregate_cache.get(server_manager, "resources")
+        if resources is None:
+            resources = server_manager.get_aggregated_resources()
+            _aggregate_cache.put(server_manager, "resources", resources)
+        result = types.ListResourcesResult(resources=resources)
+        return types.ServerResult(result)
+    except Exception:
+        logger.exception("Error listing resources")
+        return _EMPTY_RESOURCES_RESULT
+
+
+async def _list_resource_templates(
+    _server_manager: ServerManager,
+    _: types.ListResourceTemplatesRequest,
+) -> types.ServerResult:
+    # For now, return empty templates as we don't aggregate templates yet
+    result = types.ListResourceTemplatesResult(resourceTemplates=[])
+    return types.ServerResult(result)
+
+
+async def _read_resource(
+    server_manager: ServerManager,
+    req: types.ReadResourceRequest,
+) -> types.ServerResult:
+    # Stringify the AnyUrl once; it is reused across the call and log paths
+    uri_str = str(req.params.uri)
+    try:
+        result = await server_manager.read_resource(uri_str)
+        return types.ServerResult(result)
+    except McpError as e:
+        # Re-raise MCP errors so they're properly returned to the client
+        logger.warning("MCP error reading resource '%s': %s", uri_str, e.error.message)
+        raise
+    except Exception:
+        logger.exception("Error reading resource '%s'", uri_str)
+        return types.ServerResult(
+            types.ReadResourceResult(
+                contents=[
+                    types.TextResourceContents(
+                        uri=req.params.uri,
+                        mimeType="text/plain",
+                        text="Error occurred while reading resource",
+                    ),
+                ],
+            ),
+        )
+
+
+async def _subscribe_resource(
+    server_manager: ServerManager,
+    req: types.SubscribeRequest,
+) -> types.ServerResult:
+    uri_str = str(req.params.uri)
+    try:
+        await server_manager.subscribe_resource(uri_str)
+        logger.debug("Successfully subscribed to resource: %s", uri_str)
+        return types.ServerResult(types.EmptyResult())
+    except Exception:
+        logger.exception("Error subscribing to resource: %s", uri_str)
+        return types.ServerResult(types.EmptyResult())
+
+
+async def _unsubscribe_resource(
+    server_manager: ServerManager,
+    req: types.UnsubscribeRequest,
+) -> types.ServerResult:
+    uri_str = str(req.params.uri)
+    try:
+        await server_manager.unsubscribe_resource(uri_str)
+        logger.debug("Successfully unsubscribed from resource: %s", uri_str)
+        return types.ServerResult(types.EmptyResult())
+    except Exception:
+        logger.exception("Error unsubscribing from resource: %s", uri_str)
+        return types.ServerResult(types.EmptyResult())
+
+
+async def _list_tools(
+    server_manager: ServerManager,
+    _: types.ListToolsRequest,
+) -> types.ServerResult:
+    try:
+        tools = _aggregate_cache.get(server_manager, "tools")
+        if tools is None:
+            tools = server_manager.get_aggregated_tools()
+            _aggregate_cache.put(server_manager, "tools", tools)
+        result = types.ListToolsResult(tools=tools)
+        return types.ServerResult(result)
+    except Exception:
+        logger.exception("Error listing tools")
+        return _EMPTY_TOOLS_RESULT
+
+
+async def _call_tool(
+    server_manager: ServerManager,
+    req: types.CallToolRequest,
+) -> types.ServerResult:
+    try:
+        result = await server_manager.call_tool(
+            req.params.name,
+            req.params.arguments or {},
+        )
+        return types.ServerResult(result)
+    except McpError as e:
+        # Re-raise MCP errors so they're properly returned to the client
+        logger.warning("MCP error calling tool '%s': %s", req.params.name, e.error.message)
+        raise
+    except Exception:
+        logger.exception("Error calling tool '%s'", req.params.name)
+        return types.ServerResult(
+            types.CallToolResult(
+                content=[
+                    types.TextContent(
+                        type="text",
+                        text=f"Error occurred while calling tool: {req.params.name}",
+                    ),
+                ],
+            ),
+        )
+
+
+async def _set_logging_level(
+    server_manager: ServerManager,
+    req: types.SetLevelRequest,
+) -> types.ServerResult:
+    try:
+        level = req.params.level
+        bridge_logger = logging.getLogger("mcp_foxxy_bridge")
+        new_level = _LEVEL_MAP.get(level)
+        if new_level is not None:
+            bridge_logger.setLevel(new_level)
+
+        # Forward logging level to all managed servers
+        await server_manager.set_logging_level(level)
+
+        logger.info("Set logging level to %s", level)
+        return types.ServerResult(types.EmptyResult())
+    except Exception:
+        logger.exception("Error setting logging level")
+        return types.ServerResult(types.EmptyResult())
+
+
+async def _send_progress_notification(req: types.ProgressNotification) -> None:
+    # Bridge typically receives progress notifications from managed servers
+    # and relays them to clients transparently. The MCP framework handles
+    # the actual forwarding to connected clients automatically; logging is the
+    # only work here, so bail out before any arithmetic when INFO is off.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    if req.params.total and req.params.total > 0:
+        percentage = (req.params.progress / req.params.total) * 100
+        logger.info(
+            "Progress update: %.1f%% (%s/%s)", percentage, req.params.progress, req.params.total
+        )
+    else:
+        logger.info("Progress update: %s", req.params.progress)
+
+
+async def _complete(
+    server_manager: ServerManager,
+    req: types.CompleteRequest,
+) -> types.ServerResult:
+    try:
+        # Aggregate completions from all managed servers
+        completions = await server_manager.get_completions(
+            req.params.ref,
+            req.params.argument,
+        )
+
+        result = types.CompleteResult(completion=types.Completion(values=completions))
+        logger.debug("Returning %d aggregated completions", len(completions))
+        return types.ServerResult(result)
+    except Exception:
+        logger.exception("Error handling completion")
+        return types.ServerResult(types.CompleteResult(completion=types.Completion(values=[])))
+
+
+_BridgeHandler = Callable[..., Awaitable[types.ServerResult]]
+
+_PROMPTS_HANDLERS: dict[type, _BridgeHandler] = {
+    types.ListPromptsRequest: _list_prompts,
+    types.GetPromptRequest: _get_prompt,
+}
+
+_RESOURCES_HANDLERS: dict[type, _BridgeHandler] = {
+    types.ListResourcesRequest: _list_resources,
+    types.ListResourceTemplatesRequest: _list_resource_templates,
+    types.ReadResourceRequest: _read_resource,
+    types.SubscribeRequest: _subscribe_resource,
+    types.UnsubscribeRequest: _unsubscribe_resource,
+}
+
+_TOOLS_HANDLERS: dict[type, _BridgeHandler] = {
+    types.ListToolsRequest: _list_tools,
+    types.CallToolRequest: _call_tool,
+}
 
 
 def _configure_prompts_capability(
@@ -44,47 +400,8 @@ def _configure_prompts_capability(
 ) -> None:
     """Configure prompts capability for the bridge server."""
     logger.debug("Configuring prompts aggregation...")
-
-    async def _list_prompts(_: types.ListPromptsRequest) -> types.ServerResult:
-        try:
-            prompts = server_manager.get_aggregated_prompts()
-            result = types.ListPromptsResult(prompts=prompts)
-            return types.ServerResult(result)
-        except Exception:
-            logger.exception("Error listing prompts")
-            return types.ServerResult(types.ListPromptsResult(prompts=[]))
-
-    app.request_handlers[types.ListPromptsRequest] = _list_prompts
-
-    async def _get_prompt(req: types.GetPromptRequest) -> types.ServerResult:
-        try:
-            result = await server_manager.get_prompt(
-                req.params.name,
-                req.params.arguments,
-            )
-            return types.ServerResult(result)
-        except McpError as e:
-            # Re-raise MCP errors so they're properly returned to the client
-            logger.warning("MCP error getting prompt '%s': %s", req.params.name, e.error.message)
-            raise
-        except Exception:
-            logger.exception("Error getting prompt '%s'", req.params.name)
-            return types.ServerResult(
-                types.GetPromptResult(
-                    description=f"Error retrieving prompt: {req.params.name}",
-                    messages=[
-                        types.PromptMessage(
-                            role="user",
-                            content=types.TextContent(
-                                type="text",
-                                text="Error occurred while retrieving prompt",
-                            ),
-                        ),
-                    ],
-                ),
-            )
-
-    app.request_handlers[types.GetPromptRequest] = _get_prompt
+    for req_type, handler in _PROMPTS_HANDLERS.items():
+        app.request_handlers[req_type] = functools.partial(handler, server_manager)
 
 
 def _configure_resources_capability(
@@ -93,70 +410,8 @@ def _configure_resources_capability(
 ) -> None:
     """Configure resources capability for the bridge server."""
     logger.debug("Configuring resources aggregation...")
-
-    async def _list_resources(_: types.ListResourcesRequest) -> types.ServerResult:
-        try:
-            resources = server_manager.get_aggregated_resources()
-            result = types.ListResourcesResult(resources=resources)
-            return types.ServerResult(result)
-        except Exception:
-            logger.exception("Error listing resources")
-            return types.ServerResult(types.ListResourcesResult(resources=[]))
-
-    app.request_handlers[types.ListResourcesRequest] = _list_resources
-
-    async def _list_resource_templates(_: types.ListResourceTemplatesRequest) -> types.ServerResult:
-        # For now, return empty templates as we don't aggregate templates yet
-        result = types.ListResourceTemplatesResult(resourceTemplates=[])
-        return types.ServerResult(result)
-
-    app.request_handlers[types.ListResourceTemplatesRequest] = _list_resource_templates
-
-    async def _read_resource(req: types.ReadResourceRequest) -> types.ServerResult:
-        try:
-            result = await server_manager.read_resource(str(req.params.uri))
-            return types.ServerResult(result)
-        except McpError as e:
-            # Re-raise MCP errors so they're properly returned to the client
-            logger.warning("MCP error reading resource '%s': %s", req.params.uri, e.error.message)
-            raise
-        except Exception:
-            logger.exception("Error reading resource '%s'", req.params.uri)
-            return types.ServerResult(
-                types.ReadResourceResult(
-                    contents=[
-                        types.TextResourceContents(
-                            uri=req.params.uri,
-                            mimeType="text/plain",
-                            text="Error occurred while reading resource",
-                        ),
-                    ],
-                ),
-            )
-
-    app.request_handlers[types.ReadResourceRequest] = _read_resource
-
-    async def _subscribe_resource(req: types.SubscribeRequest) -> types.ServerResult:
-        try:
-            await server_manager.subscribe_resource(str(req.params.uri))
-            logger.debug("Successfully subscribed to resource: %s", req.params.uri)
-            return types.ServerResult(types.EmptyResult())
-        except Exception:
-            logger.exception("Error subscribing to resource: %s", req.params.uri)
-            return types.ServerResult(types.EmptyResult())
-
-    app.request_handlers[types.SubscribeRequest] = _subscribe_resource
-
-    async def _unsubscribe_resource(req: types.UnsubscribeRequest) -> types.ServerResult:
-        try:
-            await server_manager.unsubscribe_resource(str(req.params.uri))
-            logger.debug("Successfully unsubscribed from resource: %s", req.params.uri)
-            return types.ServerResult(types.EmptyResult())
-        except Exception:
-            logger.exception("Error unsubscribing from resource: %s", req.params.uri)
-            return types.ServerResult(types.EmptyResult())
-
-    app.request_handlers[types.UnsubscribeRequest] = _unsubscribe_resource
+    for req_type, handler in _RESOURCES_HANDLERS.items():
+        app.request_handlers[req_type] = functools.partial(handler, server_manager)
 
 
 def _configure_tools_capability(
@@ -165,43 +420,8 @@ def _configure_tools_capability(
 ) -> None:
     """Configure tools capability for the bridge server."""
     logger.debug("Configuring tools aggregation...")
-
-    async def _list_tools(_: types.ListToolsRequest) -> types.ServerResult:
-        try:
-            tools = server_manager.get_aggregated_tools()
-            result = types.ListToolsResult(tools=tools)
-            return types.ServerResult(result)
-        except Exception:
-            logger.exception("Error listing tools")
-            return types.ServerResult(types.ListToolsResult(tools=[]))
-
-    app.request_handlers[types.ListToolsRequest] = _list_tools
-
-    async def _call_tool(req: types.CallToolRequest) -> types.ServerResult:
-        try:
-            result = await server_manager.call_tool(
-                req.params.name,
-                req.params.arguments or {},
-            )
-            return types.ServerResult(result)
-        except McpError as e:
-            # Re-raise MCP errors so they're properly returned to the client
-            logger.warning("MCP error calling tool '%s': %s", req.params.name, e.error.message)
-            raise
-        except Exception:
-            logger.exception("Error calling tool '%s'", req.params.name)
-            return types.ServerResult(
-                types.CallToolResult(
-                    content=[
-                        types.TextContent(
-                            type="text",
-                            text=f"Error occurred while calling tool: {req.params.name}",
-                        ),
-                    ],
-                ),
-            )
-
-    app.request_handlers[types.CallToolRequest] = _call_tool
+    for req_type, handler in _TOOLS_HANDLERS.items():
+        app.request_handlers[req_type] = functools.partial(handler, server_manager)
 
 
 def _configure_logging_capability(
@@ -209,35 +429,10 @@ def _configure_logging_capability(
     server_manager: ServerManager,
 ) -> None:
     """Configure logging capability for the bridge server."""
-
-    async def _set_logging_level(req: types.SetLevelRequest) -> types.ServerResult:
-        try:
-            level = req.params.level
-            bridge_logger = logging.getLogger("mcp_foxxy_bridge")
-            level_str = str(level).lower()
-
-            if level_str == "debug":
-                bridge_logger.setLevel(logging.DEBUG)
-            elif level_str == "info":
-                bridge_logger.setLevel(logging.INFO)
-            elif level_str == "warning":
-                bridge_logger.setLevel(logging.WARNING)
-            elif level_str == "error":
-                bridge_logger.setLevel(logging.ERROR)
-
-            # Forward logging level to all managed servers
-            await server_manager.set_logging_level(level)
-
-            logger.info(
-                "Set logging level to %s",
-                str(level),
-            )
-            return types.ServerResult(types.EmptyResult())
-        except Exception:
-            logger.exception("Error setting logging level")
-            return types.ServerResult(types.EmptyResult())
-
-    app.request_handlers[types.SetLevelRequest] = _set_logging_level
+    app.request_handlers[types.SetLevelRequest] = functools.partial(
+        _set_logging_level,
+        server_manager,
+    )
 
 
 def _configure_notifications_and_completion(
@@ -245,42 +440,46 @@ def _configure_notifications_and_completion(
     server_manager: ServerManager,
 ) -> None:
     """Configure progress notifications and completion for the bridge server."""
+    app.notification_handlers[types.ProgressNotification] = _send_progress_notification
+    app.request_handlers[types.CompleteRequest] = functools.partial(_complete, server_manager)
 
-    # Add progress notification handler
-    async def _send_progress_notification(req: types.ProgressNotification) -> None:
-        logger.debug("Progress notification: %s/%s", req.params.progress, req.params.total)
-        # Bridge typically receives progress notifications from managed servers
-        # and relays them to clients transparently. The MCP framework handles
-        # the actual forwarding to connected clients automatically.
-
-        # Log the progress for debugging purposes
-        if req.params.total and req.params.total > 0:
-            percentage = (req.params.progress / req.params.total) * 100
-            logger.info(
-                "Progress update: %.1f%% (%s/%s)", percentage, req.params.progress, req.params.total
-            )
-        else:
-            logger.info("Progress update: %s", req.params.progress)
 
-    app.notification_handlers[types.ProgressNotification] = _send_progress_notification
+def _build_bridge(
+    bridge_config: BridgeConfiguration,
+    bridge_name: str,
+    *,
+    prompts: bool = True,
+    resources: bool = True,
+    tools: bool = True,
+) -> server.Server[object]:
+    """Build a bridge app around a new ServerManager and start it in background.
 
-    # Add completion handler
-    async def _complete(req: types.CompleteRequest) -> types.ServerResult:
-        try:
-            # Aggregate completions from all managed servers
-            completions = await server_manager.get_completions(
-                req.params.ref,
-                req.params.argument,
-            )
+    Shared by all bridge factories: creates the manager and app, attaches the
+    manager for cleanup, registers the requested capabilities plus logging,
+    notifications, and completion, and schedules the manager start as a
+    tracked background task so the factory returns immediately.
+    """
+    server_manager = ServerManager(bridge_config)
+    app: server.Server[object] = server.Server(name=bridge_name)
 
-            result = types.CompleteResult(completion=types.Completion(values=completions))
-            logger.debug("Returning %d aggregated completions", len(completions))
-            return types.ServerResult(result)
-        except Exception:
-            logger.exception("Error handling completion")
-            return types.ServerResult(types.CompleteResult(completion=types.Completion(values=[])))
+    # Store server manager on the app for cleanup
+    _attach_server_manager(app, server_manager)
 
-    app.request_handlers[types.CompleteRequest] = _complete
+    if prompts:
+        _configure_prompts_capability(app, server_manager)
+    if resources:
+        _configure_resources_capability(app, server_manager)
+    if tools:
+        _configure_tools_capability(app, server_manager)
+
+    _configure_logging_capability(app, server_manager)
+    _configure_notifications_and_completion(app, server_manager)
+
+    # Start server manager asynchronously in the background
+    # This allows the bridge server to start immediately without waiting for all servers
+    _register_background_task(app, asyncio.create_task(server_manager.start()))
+
+    return app
 
 
 async def create_bridge_server(bridge_config: BridgeConfiguration) -> server.Server[object]:
@@ -294,53 +493,17 @@ async def create_bridge_server(bridge_config: BridgeConfiguration) -> server.Ser
     """
     logger.info("Creating bridge server with %d configured servers", len(bridge_config.servers))
 
-    # Create the server manager without starting it yet
-    server_manager = ServerManager(bridge_config)
-
-    # Create the bridge server first
-    bridge_name = "MCP Foxxy Bridge"
-    app: server.Server[object] = server.Server(name=bridge_name)
+    # Configure capabilities based on aggregation settings, resolving the
+    # optional config chain once instead of per capability
+    aggregation = bridge_config.bridge.aggregation if bridge_config.bridge else None
 
-    # Store server manager for cleanup using registry
-    _server_manager_registry[id(app)] = server_manager
-
-    # Configure capabilities based on aggregation settings
-    if (
-        bridge_config.bridge
-        and bridge_config.bridge.aggregation
-        and bridge_config.bridge.aggregation.prompts
-    ):
-        _configure_prompts_capability(app, server_manager)
-
-    if (
-        bridge_config.bridge
-        and bridge_config.bridge.aggregation
-        and bridge_config.bridge.aggregation.resources
-    ):
-        _configure_resources_capability(app, server_manager)
-
-    if (
-        bridge_config.bridge
-        and bridge_config.bridge.aggregation
-        and bridge_config.bridge.aggregation.tools
-    ):
-        _configure_tools_capability(app, server_manager)
-
-    # Add logging capability
-    logger.debug("Configuring logging...")
-    _configure_logging_capability(app, server_manager)
-
-    # Add notifications and completion capabilities
-    _configure_notifications_and_completion(app, server_manager)
-
-    # Start server manager asynchronously in the background
-    # This allows the bridge server to start immediately without waiting for all servers
-    start_task = asyncio.create_task(server_manager.start())
-    # Store task reference to prevent garbage collection
-    if not hasattr(app, "background_tasks"):
-        app.background_tasks = set()  # type: ignore[attr-defined]
-    app.background_tasks.add(start_task)  # type: ignore[attr-defined]
-    start_task.add_done_callback(app.background_tasks.discard)  # type: ignore[attr-defined]
+    app = _build_bridge(
+        bridge_config,
+        "MCP Foxxy Bridge",
+        prompts=bool(aggregation and aggregation.prompts),
+        resources=bool(aggregation and aggregation.resources),
+        tools=bool(aggregation and aggregation.tools),
+    )
 
     logger.info("Bridge server created successfully, servers connecting in background...")
 
@@ -355,12 +518,22 @@ async def shutdown_bridge_server(app: server.Server[object]) -> None:
     """
     logger.info("Shutting down bridge server...")
 
-    # Stop the server manager if it exists in registry
-    app_id = id(app)
-    if app_id in _server_manager_registry:
-        server_manager = _server_manager_registry.pop(app_id)
-        if server_manager:
-            await server_manager.stop()
+    # Cancel any still-running background work (e.g. a start() that is racing
+    # shutdown) before stopping the manager
+    background_tasks: set[asyncio.Task[None]] = getattr(app, "background_tasks", set())
+    if background_tasks:
+        pending = [task for task in background_tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    # Stop the server manager attached to this app, if any
+    server_manager = get_server_manager(app)
+    if server_manager is not None:
+        setattr(app, _MANAGER_ATTR, None)
+        _aggregate_cache.discard(server_manager)
+        await server_manager.stop()
 
     logger.info("Bridge server shutdown complete")
 
@@ -382,18 +555,19 @@ async def create_tag_filtered_bridge(
     Returns:
         A configured MCP server that bridges to tag-filtered servers
     """
+    # Build the filter set once instead of per server inside the comprehension.
+    filter_tags = frozenset(tags)
 
     def matches_tag_filter(server_config: BridgeServerConfig) -> bool:
-        if not server_config.tags:
+        if not filter_tags or not server_config.tags:
             return False
 
-        server_tags = set(server_config.tags)
-        filter_tags = set(tags)
+        server_tags = frozenset(server_config.tags)
 
         if tag_mode == "intersection":
-            return filter_tags.issubset(server_tags)
+            return filter_tags <= server_tags
         if tag_mode == "union":
-            return bool(filter_tags.intersection(server_tags))
+            return not filter_tags.isdisjoint(server_tags)
         return False
 
     # Filter servers by tag criteria
@@ -419,31 +593,16 @@ async def create_tag_filtered_bridge(
         bridge=None,  # Use default bridge config
     )
 
-    # Create server manager with filtered servers
-    server_manager = ServerManager(tag_bridge_config)
-    await server_manager.start()
-
-    # Create the bridge server
+    # Build the bridge with all capabilities enabled (default aggregation)
     tag_display = "+".join(tags) if tag_mode == "intersection" else ",".join(tags)
-    bridge_name = f"MCP Foxxy Bridge - Tags: {tag_display}{bridge_name_suffix}"
-    app: server.Server[object] = server.Server(name=bridge_name)
-
-    # Store server manager for cleanup
-    _server_manager_registry[id(app)] = server_manager
-
-    # Configure capabilities with aggregation (since we may have multiple servers)
-    # Use default aggregation settings - tools, resources, and prompts enabled
-    _configure_prompts_capability(app, server_manager)
-    _configure_resources_capability(app, server_manager)
-    _configure_tools_capability(app, server_manager)
-    _configure_logging_capability(app, server_manager)
-    _configure_notifications_and_completion(app, server_manager)
+    app = _build_bridge(
+        tag_bridge_config,
+        f"MCP Foxxy Bridge - Tags: {tag_display}{bridge_name_suffix}",
+    )
 
-    active_servers = server_manager.get_active_servers()
     logger.info(
-        "Tag-filtered bridge created successfully for tags %s - %d active servers",
+        "Tag-filtered bridge created successfully for tags %s - servers connecting in background",
         tags,
-        len(active_servers),
     )
 
     return app
@@ -473,39 +632,17 @@ async def create_single_server_bridge(
         bridge=None,  # Use default bridge config
     )
 
-    # Create a server manager with just this one server
-    server_manager = ServerManager(single_server_config)
-    await server_manager.start()
-
-    # Create the bridge server
-    bridge_name = f"MCP Foxxy Bridge - {server_name}"
-    app: server.Server[object] = server.Server(name=bridge_name)
-
-    # Store server manager for cleanup
-    _server_manager_registry[id(app)] = server_manager
-
     # For single server bridges, we want to expose capabilities directly
-    # without namespacing, so we configure all capabilities regardless of
+    # without namespacing, so all capabilities are enabled regardless of
     # aggregation settings (there's no aggregation conflict with one server)
+    app = _build_bridge(
+        single_server_config,
+        f"MCP Foxxy Bridge - {server_name}",
+    )
 
-    # Configure all capabilities (no aggregation conflicts with single server)
-    _configure_prompts_capability(app, server_manager)
-    _configure_resources_capability(app, server_manager)
-    _configure_tools_capability(app, server_manager)
-    _configure_logging_capability(app, server_manager)
-    _configure_notifications_and_completion(app, server_manager)
-
-    active_servers = server_manager.get_active_servers()
-    if active_servers:
-        logger.info(
-            "Single-server bridge created successfully for '%s' "
-            "(%d tools, %d resources, %d prompts)",
-            server_name,
-            len(active_servers[0].tools),
-            len(active_servers[0].resources),
-            len(active_servers[0].prompts),
-        )
-    else:
-        logger.warning("Single-server bridge created but server '%s' is not active", server_name)
+    logger.info(
+        "Single-server bridge created successfully for '%s' - server connecting in background",
+        server_name,
+    )
 
     return app
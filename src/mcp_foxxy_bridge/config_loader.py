@@ -26,13 +26,14 @@ This module provides functionality to load named server configurations from JSON
 with enhanced bridge-specific configuration options.
 """
 
+import functools
 import json
 import logging
 import os
 import re
 import shlex
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -48,9 +49,13 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_server_name(server_name: str) -> str:
     """Normalize server name for URL-safe usage.
 
+    The function is pure, so results are memoized; reload paths call it
+    repeatedly with the same configured names.
+
     Converts server names to lowercase, replaces spaces and special characters
     with underscores, and ensures the name is URL-safe for use in endpoints.
 
@@ -313,7 +318,7 @@ class HealthCheckConfig:
     max_restart_attempts: int = 5  # maximum restart attempts before giving up
 
     # Health check operation configuration
-    operation: str = "list_tools"  # MCP operation to use for health checks
+    operation: str = "ping"  # MCP operation to use for health checks
     tool_name: str | None = None  # Specific tool name if operation is "call_tool"
     tool_arguments: dict[str, str] | None = None  # Arguments for tool calls
     resource_uri: str | None = None  # Resource URI if operation is "read_resource"
@@ -326,6 +331,10 @@ class HealthCheckConfig:
     expected_status: int = 200  # Expected HTTP status code
     expected_content: str | None = None  # Expected content substring
 
+    def __post_init__(self) -> None:
+        """Normalize the operation name once so per-tick dispatch skips it."""
+        self.operation = self.operation.lower()
+
 
 @dataclass
 class BridgeServerConfig:
@@ -347,6 +356,7 @@ class BridgeServerConfig:
     priority: int = 100
     tags: list[str] | None = None
     log_level: str = "ERROR"  # Default to quiet (only errors)
+    _fingerprint: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Initialize default values for optional fields."""
@@ -359,6 +369,30 @@ class BridgeServerConfig:
         if self.tags is None:
             self.tags = []
 
+    def change_fingerprint(self) -> int:
+        """Hash of the fields that matter for reload change detection.
+
+        Computed lazily and cached; configs are treated as immutable once
+        loaded, so the cached value stays valid for the object's lifetime.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = hash(
+                (
+                    self.enabled,
+                    self.command,
+                    tuple(self.args or ()),
+                    tuple(sorted((self.env or {}).items())),
+                    self.priority,
+                    self.timeout,
+                    tuple(sorted(self.tags or ())),
+                    self.tool_namespace,
+                    self.resource_namespace,
+                    self.prompt_namespace,
+                    repr(self.health_check),
+                ),
+            )
+        return self._fingerprint
+
 
 @dataclass
 class AggregationConfig:
@@ -399,6 +433,7 @@ class BridgeConfig:
     host: str = "127.0.0.1"  # Default to localhost for security
     port: int = 8080  # Default port
     mcp_log_level: str = "ERROR"  # Default log level for all MCP servers
+    max_concurrent_backends: int = 32  # Concurrency limit for backend fan-out
 
     def __post_init__(self) -> None:
         """Initialize default values for bridge configuration."""
@@ -548,6 +583,7 @@ def validate_bridge_config(config_data: dict[str, Any]) -> None:
                     },
                     "host": {"type": "string"},
                     "port": {"type": "number", "minimum": 1, "maximum": 65535},
+                    "maxConcurrentBackends": {"type": "number", "minimum": 1},
                 },
             },
         },
@@ -662,7 +698,7 @@ def validate_server_config(name: str, server_config: dict[str, Any]) -> list[str
                 )
 
         # Validate operation field
-        operation = health_check.get("operation", "list_tools")
+        operation = health_check.get("operation", "ping")
         valid_operations = [
             "list_tools",
             "list_resources",
@@ -889,7 +925,7 @@ def load_bridge_config_from_file(
             auto_restart=health_check_data.get("autoRestart", True),
             restart_delay=health_check_data.get("restartDelay", 5000),
             max_restart_attempts=health_check_data.get("maxRestartAttempts", 5),
-            operation=health_check_data.get("operation", "list_tools"),
+            operation=health_check_data.get("operation", "ping"),
             tool_name=health_check_data.get("toolName"),
             tool_arguments=health_check_data.get("toolArguments"),
             resource_uri=health_check_data.get("resourceUri"),
@@ -984,6 +1020,7 @@ def load_bridge_config_from_file(
         host=bridge_data.get("host", "127.0.0.1"),
         port=bridge_data.get("port", 8080),
         mcp_log_level=bridge_data.get("mcp_log_level", "ERROR"),
+        max_concurrent_backends=bridge_data.get("maxConcurrentBackends", 32),
     )
 
     return BridgeConfiguration(servers=servers, bridge=bridge)
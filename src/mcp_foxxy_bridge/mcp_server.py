@@ -49,10 +49,10 @@ from starlette.routing import BaseRoute, Mount, Route
 from starlette.types import Receive, Scope, Send
 
 from .bridge_server import (
-    _server_manager_registry,
     create_bridge_server,
     create_single_server_bridge,
     create_tag_filtered_bridge,
+    get_server_manager,
     shutdown_bridge_server,
 )
 from .config_loader import (
@@ -69,7 +69,7 @@ logger = logging.getLogger(__name__)
 # Global variables for config reloading
 _current_bridge_config: BridgeConfiguration | None = None
 _current_config_path: str | None = None
-_server_manager_reference: object | None = None
+_server_manager_reference: MCPServerSDK[object] | None = None
 
 
 @dataclass
@@ -476,11 +476,11 @@ async def handle_server_discovery(request: Request) -> Response:
 
                 # Get server status if we can access the server manager
                 server_status = "unknown"
-                for manager in _server_manager_registry.values():
+                manager = get_server_manager(_server_manager_reference)
+                if manager:
                     server = manager.get_server_by_name(server_name)
                     if server:
                         server_status = server.health.status.value
-                        break
 
                 available_servers.append(
                     {
@@ -523,11 +523,11 @@ async def handle_tag_discovery(request: Request) -> Response:
             if server_config.enabled and server_config.tags:
                 # Get server status
                 server_status = "unknown"
-                for manager in _server_manager_registry.values():
+                manager = get_server_manager(_server_manager_reference)
+                if manager:
                     server = manager.get_server_by_name(server_name)
                     if server:
                         server_status = server.health.status.value
-                        break
 
                 # Add this server to each of its tags
                 for tag in server_config.tags:
@@ -720,15 +720,11 @@ async def _handle_config_reload() -> bool:
         new_config = load_bridge_config_from_file(_current_config_path, base_env)
 
         # Validate configuration before applying
-        if (
-            not _server_manager_reference
-            or _server_manager_reference not in _server_manager_registry
-        ):
+        server_manager = get_server_manager(_server_manager_reference)
+        if server_manager is None:
             logger.error("No active server manager found for config reload")
             return False
 
-        server_manager = _server_manager_registry[_server_manager_reference]
-
         # Check if we're in validate-only mode
         if (
             _current_bridge_config
@@ -739,12 +735,13 @@ async def _handle_config_reload() -> bool:
             logger.info("Configuration validation successful (validate_only mode)")
             return True
 
-        # Apply configuration changes through server manager
+        # Apply the bridge-level settings first (conflict resolution,
+        # namespacing, failover, log levels) so the server reconciliation
+        # below recomputes everything against the new config, then apply
+        # the per-server changes.
+        server_manager.reload_bridge_config(new_config)
         await server_manager.update_servers(new_config.servers)
 
-        # Update bridge config (this mainly affects conflict resolution, namespacing, etc.)
-        server_manager.bridge_config = new_config
-
         # Update the global config reference
         _current_bridge_config = new_config
 
@@ -806,7 +803,7 @@ async def run_bridge_server(
         bridge_server = await create_bridge_server(bridge_config)
 
         # Store server manager reference for config reloading
-        _server_manager_reference = id(bridge_server)
+        _server_manager_reference = bridge_server
 
         # Setup config file watcher if enabled and config path provided
         config_watcher = None
@@ -24,11 +24,13 @@ and aggregate their capabilities for the bridge.
 
 import asyncio
 import contextlib
+import functools
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
 from mcp import types
 from mcp.client.session import ClientSession
@@ -46,6 +48,14 @@ from .stdio_client_wrapper import stdio_client_with_logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_url(uri: str) -> AnyUrl:
+    """Parse a URI string into an AnyUrl, memoizing repeated parses."""
+    return AnyUrl(uri)
+
 
 class ServerStatus(Enum):
     """Status of a managed MCP server."""
@@ -57,7 +67,7 @@ class ServerStatus(Enum):
     DISABLED = "disabled"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerHealth:
     """Health tracking for a managed server."""
 
@@ -71,9 +81,11 @@ class ServerHealth:
     last_restart: float | None = None
     last_keep_alive: float = field(default_factory=time.time)
     keep_alive_failures: int = 0
+    next_health_check: float = 0.0
+    next_keep_alive: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedServer:
     """Represents a managed MCP server connection."""
 
@@ -83,7 +95,22 @@ class ManagedServer:
     health: ServerHealth = field(default_factory=ServerHealth)
     tools: list[types.Tool] = field(default_factory=list)
     resources: list[types.Resource] = field(default_factory=list)
+    # Stringified URIs parallel to `resources`, computed once on load so hot
+    # paths avoid repeated AnyUrl.__str__ calls.
+    resource_uri_strs: list[str] = field(default_factory=list)
     prompts: list[types.Prompt] = field(default_factory=list)
+    # Lookup dicts rebuilt alongside the lists on capability load so
+    # membership probes are O(1) instead of linear scans.
+    tools_by_name: dict[str, types.Tool] = field(default_factory=dict)
+    resources_by_uri: dict[str, types.Resource] = field(default_factory=dict)
+    prompts_by_name: dict[str, types.Prompt] = field(default_factory=dict)
+    # Memoized effective namespace per capability type; the aggregators call
+    # get_effective_namespace in tight per-tool loops, so resolution happens
+    # once per (server, capability) until the config changes.
+    _namespace_cache: dict[str, str | None] = field(default_factory=dict)
+    # Memoized static "config" portion of the status payload; rebuilt only
+    # after a configuration change.
+    _status_config: dict[str, Any] | None = field(default=None)
 
     def get_effective_namespace(
         self,
@@ -91,19 +118,44 @@ class ManagedServer:
         bridge_config: BridgeConfig | None,
     ) -> str | None:
         """Get the effective namespace for a capability type."""
+        if capability_type in self._namespace_cache:
+            return self._namespace_cache[capability_type]
+
+        namespace: str | None = None
         # Check explicit namespace configuration
         if capability_type == "tools" and self.config.tool_namespace:
-            return self.config.tool_namespace
-        if capability_type == "resources" and self.config.resource_namespace:
-            return self.config.resource_namespace
-        if capability_type == "prompts" and self.config.prompt_namespace:
-            return self.config.prompt_namespace
-
+            namespace = self.config.tool_namespace
+        elif capability_type == "resources" and self.config.resource_namespace:
+            namespace = self.config.resource_namespace
+        elif capability_type == "prompts" and self.config.prompt_namespace:
+            namespace = self.config.prompt_namespace
         # Check if default namespace is enabled
-        if bridge_config and bridge_config.default_namespace:
-            return self.name
+        elif bridge_config and bridge_config.default_namespace:
+            namespace = self.name
+
+        self._namespace_cache[capability_type] = namespace
+        return namespace
+
+    def get_status_config(self) -> dict[str, Any]:
+        """Return the static config portion of the status payload."""
+        if self._status_config is None:
+            hc = self.config.health_check
+            self._status_config = {
+                "enabled": self.config.enabled,
+                "command": self.config.command,
+                "args": self.config.args,
+                "priority": self.config.priority,
+                "tags": self.config.tags,
+                "health_check_enabled": hc.enabled if hc else False,
+                "health_check_operation": hc.operation if hc else "list_tools",
+                "auto_restart": hc.auto_restart if hc else False,
+            }
+        return self._status_config
 
-        return None
+    def invalidate_namespace_cache(self) -> None:
+        """Drop memoized namespaces and status snapshots after a configuration change."""
+        self._namespace_cache.clear()
+        self._status_config = None
 
 
 class ServerManager:
@@ -113,22 +165,117 @@ class ServerManager:
         """Initialize the server manager with bridge configuration."""
         self.bridge_config = bridge_config
         self.servers: dict[str, ManagedServer] = {}
-        self.health_check_task: asyncio.Task[None] | None = None
-        self.keep_alive_task: asyncio.Task[None] | None = None
+        self.maintenance_task: asyncio.Task[None] | None = None
         self._shutdown_event = asyncio.Event()
         self._context_stack = contextlib.AsyncExitStack()
         self._restart_locks: dict[str, asyncio.Lock] = {}
+        # Strong references to in-flight restart tasks so they are not GC'd
+        self._restart_tasks: set[asyncio.Task[None]] = set()
+        # Maps raw and normalized server names to the canonical key in
+        # self.servers so lookups avoid re-normalizing on every call.
+        self._name_aliases: dict[str, str] = {}
+        # Memoized effective log levels keyed by config object identity;
+        # cleared whenever a server config is replaced.
+        self._log_level_cache: dict[int, str] = {}
+        # Bumped whenever server capabilities change so consumers can cache
+        # aggregated views and invalidate cheaply.
+        self.capability_cache_version = 0
+        # Bounds concurrent backend fan-out so wide gathers cannot overwhelm
+        # slow upstreams or exhaust file descriptors.
+        max_fanout = bridge_config.bridge.max_concurrent_backends if bridge_config.bridge else 32
+        self._fanout_semaphore = asyncio.Semaphore(max_fanout)
+        # Snapshots of bridge-level settings that never change at runtime so
+        # hot paths avoid re-walking the nested config on every iteration.
+        bridge = bridge_config.bridge
+        self._conflict_resolution = bridge.conflict_resolution if bridge else None
+        self._failover_enabled = bool(bridge and bridge.failover and bridge.failover.enabled)
+        self._failover_max_failures = (
+            bridge.failover.max_failures if bridge and bridge.failover else None
+        )
+        # Dispatch table for configured health-check operations; ping-style
+        # aliases share the lightweight protocol ping.
+        self._hc_ops: dict[str, Callable[[ManagedServer, ClientSession], Awaitable[None]]] = {
+            "list_tools": self._hc_list_tools,
+            "list_resources": self._hc_list_resources,
+            "list_prompts": self._hc_list_prompts,
+            "call_tool": self._hc_call_tool,
+            "read_resource": self._hc_read_resource,
+            "get_prompt": self._hc_get_prompt,
+            "ping": self._hc_ping,
+            "health": self._hc_ping,
+            "status": self._hc_ping,
+        }
+        # Routing tables from exposed tool/resource/prompt names to their
+        # (server, bare name) owner, rebuilt lazily per capability version.
+        self._owner_maps: dict[str, tuple[int, dict[str, tuple[ManagedServer, str]]]] = {}
+        # Inverted index from bare resource URI to the priority-ordered
+        # servers that expose it, used by subscribe/unsubscribe routing.
+        self._resource_uri_owners: tuple[int, dict[str, list[ManagedServer]]] | None = None
+        # Companion index from (namespace, bare URI) to the owning server so
+        # namespaced subscriptions resolve with one dict lookup.
+        self._resource_ns_owners: tuple[int, dict[tuple[str, str], ManagedServer]] | None = None
+        # Memoized aggregated capability lists, keyed by category and tagged
+        # with the capability cache version they were built against.
+        self._agg_cache: dict[str, tuple[int, list[Any]]] = {}
+        # Cached active-server views; every status transition bumps the
+        # capability cache version, so these track connects/disconnects.
+        self._active_servers: list[ManagedServer] = []
+        self._active_servers_version = -1
+        self._active_sorted: list[ManagedServer] = []
+        self._active_sorted_version = -1
+
+    def bump_cache_version(self) -> None:
+        """Invalidate any cached aggregated capability views."""
+        self.capability_cache_version += 1
+
+    def reload_bridge_config(self, bridge_config: BridgeConfiguration) -> None:
+        """Apply a reloaded bridge configuration to this manager.
+
+        Re-snapshots the bridge-level settings captured in ``__init__`` and
+        drops the log-level memos so conflict resolution, failover limits and
+        the global MCP log level from the new config take effect immediately
+        instead of being pinned to the values read at startup. Every cached
+        view derived from the old bridge config is invalidated as well.
+        """
+        self.bridge_config = bridge_config
+        bridge = bridge_config.bridge
+        self._conflict_resolution = bridge.conflict_resolution if bridge else None
+        self._failover_enabled = bool(bridge and bridge.failover and bridge.failover.enabled)
+        self._failover_max_failures = (
+            bridge.failover.max_failures if bridge and bridge.failover else None
+        )
+        self._log_level_cache.clear()
+        # Bridge-level settings such as defaultNamespace feed the per-server
+        # namespace memos, so drop them for every server — not just the ones
+        # whose own config changed — and bump the version so aggregations,
+        # routing maps and active-server views rebuild.
+        for server in self.servers.values():
+            server.invalidate_namespace_cache()
+        self.bump_cache_version()
+
+    async def _bounded_fanout(self, coro: Awaitable[T]) -> T:
+        """Run a backend coroutine under the fan-out concurrency limit."""
+        async with self._fanout_semaphore:
+            return await coro
 
     def _get_effective_log_level(self, server_config: BridgeServerConfig) -> str:
         """Get the effective log level for a server (server-specific or global default)."""
+        cached = self._log_level_cache.get(id(server_config))
+        if cached is not None:
+            return cached
+
         # Server-specific log level takes precedence over global setting
         if hasattr(server_config, "log_level") and server_config.log_level:
-            return server_config.log_level
-        # Fall back to global bridge log level
-        if self.bridge_config.bridge and hasattr(self.bridge_config.bridge, "mcp_log_level"):
-            return self.bridge_config.bridge.mcp_log_level
-        # Final fallback to ERROR (quiet mode)
-        return "ERROR"
+            level = server_config.log_level
+        elif self.bridge_config.bridge and hasattr(self.bridge_config.bridge, "mcp_log_level"):
+            # Fall back to global bridge log level
+            level = self.bridge_config.bridge.mcp_log_level
+        else:
+            # Final fallback to ERROR (quiet mode)
+            level = "ERROR"
+
+        self._log_level_cache[id(server_config)] = level
+        return level
 
     async def start(self) -> None:
         """Start the server manager and connect to all configured servers."""
@@ -147,38 +294,27 @@ class ServerManager:
             normalized_name = normalize_server_name(name)
             managed_server = ManagedServer(name=normalized_name, config=config)
             self.servers[normalized_name] = managed_server
-            self._restart_locks[normalized_name] = asyncio.Lock()
-
-        # Start connections
-        connection_tasks = []
-        for server in self.servers.values():
-            task = asyncio.create_task(self._connect_server(server))
-            connection_tasks.append(task)
+            self._name_aliases[name] = normalized_name
+            self._name_aliases[normalized_name] = normalized_name
 
-        # Wait for initial connections (with timeout)
-        if connection_tasks:
+        # Start connections with bounded concurrency so large configurations
+        # do not spawn every stdio subprocess at once; _connect_server records
+        # failures itself, so the group only propagates cancellation.
+        if self.servers:
             try:
-                await asyncio.wait_for(
-                    asyncio.gather(*connection_tasks, return_exceptions=True),
-                    timeout=30.0,
-                )
+                async with asyncio.timeout(30.0), asyncio.TaskGroup() as tg:
+                    for server in self.servers.values():
+                        tg.create_task(self._bounded_fanout(self._connect_server(server)))
             except TimeoutError:
                 logger.warning("Some servers took longer than 30 seconds to connect")
 
-        # Start health check and keep-alive tasks
-        if (
-            self.bridge_config.bridge
-            and self.bridge_config.bridge.failover
-            and self.bridge_config.bridge.failover.enabled
-        ):
-            self.health_check_task = asyncio.create_task(self._health_check_loop())
-
-        # Start keep-alive task for all servers with keep-alive enabled
-        if any(
+        # Start the unified maintenance loop (health checks + keep-alives)
+        keep_alive_enabled = any(
             server.config.health_check and server.config.health_check.enabled
             for server in self.servers.values()
-        ):
-            self.keep_alive_task = asyncio.create_task(self._keep_alive_loop())
+        )
+        if self._failover_enabled or keep_alive_enabled:
+            self.maintenance_task = asyncio.create_task(self._maintenance_loop())
 
         logger.info("Server manager started with %d active servers", len(self.get_active_servers()))
 
@@ -189,16 +325,11 @@ class ServerManager:
         # Signal shutdown
         self._shutdown_event.set()
 
-        # Cancel health check and keep-alive tasks
-        if self.health_check_task:
-            self.health_check_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self.health_check_task
-
-        if self.keep_alive_task:
-            self.keep_alive_task.cancel()
+        # Cancel the maintenance loop
+        if self.maintenance_task:
+            self.maintenance_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self.keep_alive_task
+                await self.maintenance_task
 
         # Close the context stack to cleanup all managed connections
         # This will gracefully terminate all child processes
@@ -298,7 +429,12 @@ class ServerManager:
         server.health.keep_alive_failures = 0
         server.tools.clear()
         server.resources.clear()
+        server.resource_uri_strs.clear()
         server.prompts.clear()
+        server.tools_by_name.clear()
+        server.resources_by_uri.clear()
+        server.prompts_by_name.clear()
+        self.bump_cache_version()
 
     async def _load_server_capabilities(self, server: ManagedServer) -> None:
         """Load capabilities from a connected server."""
@@ -310,33 +446,58 @@ class ServerManager:
             if server.config.health_check:
                 await self._validate_health_check_config(server)
 
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
             # Load tools
             if server.health.capabilities.tools:
                 tools_result = await server.session.list_tools()
                 server.tools = tools_result.tools
-                logger.debug("Loaded %d tools from server '%s'", len(server.tools), server.name)
+                server.tools_by_name = {tool.name: tool for tool in server.tools}
+                if debug_enabled:
+                    logger.debug(
+                        "Loaded %d tools from server '%s'",
+                        len(server.tools),
+                        server.name,
+                    )
 
             # Load resources
             if server.health.capabilities.resources:
                 resources_result = await server.session.list_resources()
                 server.resources = resources_result.resources
-                logger.debug(
-                    "Loaded %d resources from server '%s'",
-                    len(server.resources),
-                    server.name,
+                server.resource_uri_strs = [str(resource.uri) for resource in server.resources]
+                server.resources_by_uri = dict(
+                    zip(server.resource_uri_strs, server.resources, strict=True),
                 )
+                if debug_enabled:
+                    logger.debug(
+                        "Loaded %d resources from server '%s'",
+                        len(server.resources),
+                        server.name,
+                    )
 
             # Load prompts
             if server.health.capabilities.prompts:
                 prompts_result = await server.session.list_prompts()
                 server.prompts = prompts_result.prompts
-                logger.debug("Loaded %d prompts from server '%s'", len(server.prompts), server.name)
+                server.prompts_by_name = {prompt.name: prompt for prompt in server.prompts}
+                if debug_enabled:
+                    logger.debug(
+                        "Loaded %d prompts from server '%s'",
+                        len(server.prompts),
+                        server.name,
+                    )
 
         except Exception:
             logger.exception(
                 "Failed to load capabilities from server '%s'",
                 server.name,
             )
+        finally:
+            # Bump even when loading fails partway: the server is already
+            # CONNECTED at this point, and without the bump the version-keyed
+            # caches (active lists, routing maps, aggregations) would keep
+            # ignoring it until some unrelated event invalidated them
+            self.bump_cache_version()
 
     async def _validate_health_check_config(self, server: ManagedServer) -> None:
         """Validate health check configuration against server capabilities."""
@@ -368,7 +529,7 @@ class ServerManager:
 
         # Validate specific tool exists if configured
         if hc.operation == "call_tool" and hc.tool_name and server.tools:
-            tool_exists = any(tool.name == hc.tool_name for tool in server.tools)
+            tool_exists = hc.tool_name in server.tools_by_name
             if not tool_exists:
                 logger.warning(
                     "Server '%s' health check configured for tool '%s' but tool not found",
@@ -378,9 +539,7 @@ class ServerManager:
 
         # Validate resource URI exists if configured
         if hc.operation == "read_resource" and hc.resource_uri and server.resources:
-            resource_exists = any(
-                str(resource.uri) == hc.resource_uri for resource in server.resources
-            )
+            resource_exists = hc.resource_uri in server.resources_by_uri
             if not resource_exists:
                 logger.warning(
                     "Server '%s' health check configured for resource '%s' but resource not found",
@@ -390,7 +549,7 @@ class ServerManager:
 
         # Validate prompt exists if configured
         if hc.operation == "get_prompt" and hc.prompt_name and server.prompts:
-            prompt_exists = any(prompt.name == hc.prompt_name for prompt in server.prompts)
+            prompt_exists = hc.prompt_name in server.prompts_by_name
             if not prompt_exists:
                 logger.warning(
                     "Server '%s' health check configured for prompt '%s' but prompt not found",
@@ -398,112 +557,142 @@ class ServerManager:
                     hc.prompt_name,
                 )
 
-    async def _health_check_loop(self) -> None:
-        """Background health check loop."""
+    async def _maintenance_loop(self) -> None:
+        """Unified health-check and keep-alive loop driven by per-server deadlines."""
+        failover_enabled = self._failover_enabled
         while not self._shutdown_event.is_set():
             try:
-                await self._perform_health_checks()
-                await asyncio.sleep(30)  # Check every 30 seconds
+                now = time.time()
+                next_wake = now + 60.0  # Upper bound when nothing is scheduled
+                due_checks: list[Awaitable[None]] = []
+
+                # The cached active list already excludes non-connected servers
+                for server in self.get_active_servers():
+                    if not server.session:
+                        continue
+                    hc = server.config.health_check
+
+                    if failover_enabled:
+                        interval = hc.interval / 1000.0 if hc else 30.0
+                        if now >= server.health.next_health_check:
+                            server.health.next_health_check = now + interval
+                            due_checks.append(self._check_server_health(server))
+                        next_wake = min(next_wake, server.health.next_health_check)
+
+                    if hc and hc.enabled:
+                        if now >= server.health.next_keep_alive:
+                            server.health.next_keep_alive = now + hc.keep_alive_interval / 1000.0
+                            due_checks.append(self._send_keep_alive(server))
+                        next_wake = min(next_wake, server.health.next_keep_alive)
+
+                if due_checks:
+                    await asyncio.gather(
+                        *(self._bounded_fanout(check) for check in due_checks),
+                        return_exceptions=True,
+                    )
+
+                await asyncio.sleep(max(next_wake - time.time(), 0.1))
             except asyncio.CancelledError:
                 break
             except Exception:
-                logger.exception("Error in health check loop")
+                logger.exception("Error in maintenance loop")
                 await asyncio.sleep(5)  # Brief pause before retrying
 
-    async def _keep_alive_loop(self) -> None:
-        """Keep-alive loop for all servers."""
-        while not self._shutdown_event.is_set():
-            try:
-                await self._perform_keep_alive_checks()
-                # Use the minimum keep-alive interval from all servers
-                min_interval = min(
-                    (
-                        server.config.health_check.keep_alive_interval / 1000.0
-                        for server in self.servers.values()
-                        if server.config.health_check and server.config.health_check.enabled
-                    ),
-                    default=60.0,
+    async def _check_server_health(self, server: ManagedServer) -> None:
+        """Perform a health check on a single server."""
+        try:
+            # Use configured health check operation
+            health_timeout = 5.0
+            if server.config.health_check:
+                health_timeout = server.config.health_check.timeout / 1000.0
+
+            await asyncio.wait_for(
+                self._execute_health_check_operation(server),
+                timeout=health_timeout,
+            )
+            server.health.last_seen = time.time()
+            server.health.consecutive_failures = 0  # Reset on successful check
+
+        except Exception as e:
+            logger.warning("Health check failed for server '%s': %s", server.name, str(e))
+            server.health.failure_count += 1
+            server.health.consecutive_failures += 1
+            server.health.last_error = str(e)
+
+            # Check if server should be marked as failed
+            max_failures = self._failover_max_failures
+            if max_failures is None:
+                max_failures = (
+                    server.config.health_check.max_consecutive_failures
+                    if server.config.health_check
+                    else 3
                 )
-                await asyncio.sleep(min_interval)
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                logger.exception("Error in keep-alive loop")
-                await asyncio.sleep(5)  # Brief pause before retrying
 
-    async def _perform_health_checks(self) -> None:
-        """Perform health checks on all servers."""
-        for server in self.servers.values():
-            if server.health.status == ServerStatus.CONNECTED and server.session:
-                try:
-                    # Use configured health check operation
-                    health_timeout = 5.0
-                    if server.config.health_check:
-                        health_timeout = server.config.health_check.timeout / 1000.0
-
-                    await asyncio.wait_for(
-                        self._execute_health_check_operation(server),
-                        timeout=health_timeout,
-                    )
-                    server.health.last_seen = time.time()
-                    server.health.consecutive_failures = 0  # Reset on successful check
-
-                except Exception as e:
-                    logger.warning("Health check failed for server '%s': %s", server.name, str(e))
-                    server.health.failure_count += 1
-                    server.health.consecutive_failures += 1
-                    server.health.last_error = str(e)
-
-                    # Check if server should be marked as failed
-                    max_failures = 3  # Default
-                    if self.bridge_config.bridge and self.bridge_config.bridge.failover:
-                        max_failures = self.bridge_config.bridge.failover.max_failures
-                    elif server.config.health_check:
-                        max_failures = server.config.health_check.max_consecutive_failures
-
-                    if server.health.consecutive_failures >= max_failures:
-                        logger.exception(
-                            "Server '%s' marked as failed after %d consecutive failures",
-                            server.name,
-                            server.health.consecutive_failures,
-                        )
-                        server.health.status = ServerStatus.FAILED
-                        await self._disconnect_server(server)
-
-                        # Attempt automatic restart if enabled
-                        if (
-                            server.config.health_check
-                            and server.config.health_check.auto_restart
-                            and server.health.restart_count
-                            < server.config.health_check.max_restart_attempts
-                        ):
-                            # Start restart task and store reference to prevent GC
-                            restart_task = asyncio.create_task(self._restart_server(server))
-                            if not hasattr(self, "_restart_tasks"):
-                                self._restart_tasks = set()
-                            self._restart_tasks.add(restart_task)
-                            restart_task.add_done_callback(self._restart_tasks.discard)
+            if server.health.consecutive_failures >= max_failures:
+                logger.exception(
+                    "Server '%s' marked as failed after %d consecutive failures",
+                    server.name,
+                    server.health.consecutive_failures,
+                )
+                server.health.status = ServerStatus.FAILED
+                await self._disconnect_server(server)
+
+                # Attempt automatic restart if enabled
+                if (
+                    server.config.health_check
+                    and server.config.health_check.auto_restart
+                    and server.health.restart_count
+                    < server.config.health_check.max_restart_attempts
+                ):
+                    # Start restart task and store reference to prevent GC
+                    restart_task = asyncio.create_task(self._restart_server(server))
+                    self._restart_tasks.add(restart_task)
+                    restart_task.add_done_callback(self._restart_tasks.discard)
 
     def get_active_servers(self) -> list[ManagedServer]:
         """Get list of active (connected) servers."""
-        return [
-            server
-            for server in self.servers.values()
-            if server.health.status == ServerStatus.CONNECTED
-        ]
+        if self._active_servers_version != self.capability_cache_version:
+            self._active_servers = [
+                server
+                for server in self.servers.values()
+                if server.health.status == ServerStatus.CONNECTED
+            ]
+            self._active_servers_version = self.capability_cache_version
+        return self._active_servers
+
+    def _get_active_servers_sorted(self) -> list[ManagedServer]:
+        """Get active servers sorted by priority, cached per capability version."""
+        if self._active_sorted_version != self.capability_cache_version:
+            self._active_sorted = sorted(
+                self.get_active_servers(),
+                key=lambda s: s.config.priority,
+            )
+            self._active_sorted_version = self.capability_cache_version
+        return self._active_sorted
 
     def get_server_by_name(self, name: str) -> ManagedServer | None:
         """Get a server by name."""
-        normalized_name = normalize_server_name(name)
-        return self.servers.get(normalized_name)
+        canonical = self._name_aliases.get(name)
+        if canonical is None:
+            # Unseen spelling; normalize once and remember the alias
+            canonical = normalize_server_name(name)
+            self._name_aliases[name] = canonical
+        return self.servers.get(canonical)
 
     def get_aggregated_tools(self) -> list[types.Tool]:
         """Get aggregated tools from all active servers."""
-        tools = []
-        seen_names = set()
+        cached = self._agg_cache.get("tools")
+        if cached is not None and cached[0] == self.capability_cache_version:
+            return cached[1]
+
+        tools: list[types.Tool] = []
+        append_tool = tools.append
+        seen_names: set[str] = set()
+        seen_add = seen_names.add
+        conflict = self._conflict_resolution
 
         # Sort servers by priority (lower number = higher priority)
-        active_servers = sorted(self.get_active_servers(), key=lambda s: s.config.priority)
+        active_servers = self._get_active_servers_sorted()
 
         for server in active_servers:
             namespace = server.get_effective_namespace("tools", self.bridge_config.bridge)
@@ -515,70 +704,72 @@ class ServerManager:
 
                 # Handle name conflicts based on configuration
                 if tool_name in seen_names:
-                    if (
-                        self.bridge_config.bridge
-                        and self.bridge_config.bridge.conflict_resolution == "error"
-                    ):
+                    if conflict == "error":
                         msg = f"Tool name conflict: {tool_name}"
                         raise ValueError(msg)
-                    if (
-                        self.bridge_config.bridge
-                        and self.bridge_config.bridge.conflict_resolution == "first"
-                    ):
+                    if conflict == "first":
                         continue  # Skip this tool
                     # For "priority" and "namespace", we already handled it above
 
-                # Create namespaced tool
-                namespaced_tool = types.Tool(
+                # Create namespaced tool; the payload already passed validation
+                # when the upstream server returned it, so skip re-validating.
+                namespaced_tool = types.Tool.model_construct(
                     name=tool_name,
                     description=tool.description,
                     inputSchema=tool.inputSchema,
                 )
 
-                tools.append(namespaced_tool)
-                seen_names.add(tool_name)
+                append_tool(namespaced_tool)
+                seen_add(tool_name)
 
+        self._agg_cache["tools"] = (self.capability_cache_version, tools)
         return tools
 
     def get_aggregated_resources(self) -> list[types.Resource]:
         """Get aggregated resources from all active servers."""
-        resources = []
-        seen_uris = set()
+        cached = self._agg_cache.get("resources")
+        if cached is not None and cached[0] == self.capability_cache_version:
+            return cached[1]
+
+        resources: list[types.Resource] = []
+        append_resource = resources.append
+        seen_uris: set[str] = set()
+        seen_add = seen_uris.add
+        conflict = self._conflict_resolution
 
         # Sort servers by priority
-        active_servers = sorted(self.get_active_servers(), key=lambda s: s.config.priority)
+        active_servers = self._get_active_servers_sorted()
 
         for server in active_servers:
             namespace = server.get_effective_namespace("resources", self.bridge_config.bridge)
 
-            for resource in server.resources:
-                resource_uri = str(resource.uri)
+            for resource, original_uri in zip(
+                server.resources,
+                server.resource_uri_strs,
+                strict=True,
+            ):
+                resource_uri = original_uri
                 if namespace:
                     # Create a safe namespace-prefixed URI
                     # Use a simple prefix approach instead of trying to create a valid URL scheme
-                    original_uri = str(resource.uri)
                     # Just prefix with namespace and double underscore separator
                     resource_uri = f"{namespace}__{original_uri}"
 
                 # Handle URI conflicts
                 if resource_uri in seen_uris:
-                    if (
-                        self.bridge_config.bridge
-                        and self.bridge_config.bridge.conflict_resolution == "error"
-                    ):
+                    if conflict == "error":
                         msg = f"Resource URI conflict: {resource_uri}"
                         raise ValueError(msg)
-                    if (
-                        self.bridge_config.bridge
-                        and self.bridge_config.bridge.conflict_resolution == "first"
-                    ):
+                    if conflict == "first":
                         continue
 
                 # Create namespaced resource
                 try:
-                    # Validate the URI first
-                    parsed_uri = AnyUrl(resource_uri)
-                    namespaced_resource = types.Resource(
+                    # Validate the URI first (memoized across rebuild cycles)
+                    parsed_uri = _parse_url(resource_uri)
+                    # URI is validated above; the remaining fields came
+                    # validated from upstream, so bypass re-validation.
+                    namespaced_resource = types.Resource.model_construct(
                         uri=parsed_uri,
                         name=resource.name,
                         description=resource.description,
@@ -601,23 +792,31 @@ class ServerManager:
                         resource.name,
                         server.name,
                         error_details,
-                        str(resource.uri),
+                        original_uri,
                         resource_uri,
                     )
                     continue
 
-                resources.append(namespaced_resource)
-                seen_uris.add(resource_uri)
+                append_resource(namespaced_resource)
+                seen_add(resource_uri)
 
+        self._agg_cache["resources"] = (self.capability_cache_version, resources)
         return resources
 
     def get_aggregated_prompts(self) -> list[types.Prompt]:
         """Get aggregated prompts from all active servers."""
-        prompts = []
-        seen_names = set()
+        cached = self._agg_cache.get("prompts")
+        if cached is not None and cached[0] == self.capability_cache_version:
+            return cached[1]
+
+        prompts: list[types.Prompt] = []
+        append_prompt = prompts.append
+        seen_names: set[str] = set()
+        seen_add = seen_names.add
+        conflict = self._conflict_resolution
 
         # Sort servers by priority
-        active_servers = sorted(self.get_active_servers(), key=lambda s: s.config.priority)
+        active_servers = self._get_active_servers_sorted()
 
         for server in active_servers:
             namespace = server.get_effective_namespace("prompts", self.bridge_config.bridge)
@@ -629,61 +828,85 @@ class ServerManager:
 
                 # Handle name conflicts
                 if prompt_name in seen_names:
-                    if (
-                        self.bridge_config.bridge
-                        and self.bridge_config.bridge.conflict_resolution == "error"
-                    ):
+                    if conflict == "error":
                         msg = f"Prompt name conflict: {prompt_name}"
                         raise ValueError(msg)
-                    if (
-                        self.bridge_config.bridge
-                        and self.bridge_config.bridge.conflict_resolution == "first"
-                    ):
+                    if conflict == "first":
                         continue
 
-                # Create namespaced prompt
-                namespaced_prompt = types.Prompt(
+                # Create namespaced prompt; fields came validated from upstream
+                namespaced_prompt = types.Prompt.model_construct(
                     name=prompt_name,
                     description=prompt.description,
                     arguments=prompt.arguments,
                 )
 
-                prompts.append(namespaced_prompt)
-                seen_names.add(prompt_name)
+                append_prompt(namespaced_prompt)
+                seen_add(prompt_name)
 
+        self._agg_cache["prompts"] = (self.capability_cache_version, prompts)
         return prompts
 
+    def _get_owner_map(self, category: str) -> dict[str, tuple[ManagedServer, str]]:
+        """Return the routing table for a capability category, rebuilding if stale."""
+        cached = self._owner_maps.get(category)
+        if cached is not None and cached[0] == self.capability_cache_version:
+            return cached[1]
+
+        owners: dict[str, tuple[ManagedServer, str]] = {}
+        for server in self._get_active_servers_sorted():
+            namespace = server.get_effective_namespace(category, self.bridge_config.bridge)
+            if category == "tools":
+                names = [tool.name for tool in server.tools]
+            elif category == "resources":
+                names = server.resource_uri_strs
+            else:
+                names = [prompt.name for prompt in server.prompts]
+            for name in names:
+                # setdefault keeps the highest-priority owner on conflicts
+                if namespace:
+                    owners.setdefault(f"{namespace}__{name}", (server, name))
+                # Also route bare names so un-namespaced lookups keep working
+                owners.setdefault(name, (server, name))
+        self._owner_maps[category] = (self.capability_cache_version, owners)
+        return owners
+
+    def _get_resource_uri_owners(self) -> dict[str, list[ManagedServer]]:
+        """Return the bare-URI inverted index, rebuilding if stale."""
+        cached = self._resource_uri_owners
+        if cached is not None and cached[0] == self.capability_cache_version:
+            return cached[1]
+
+        owners: dict[str, list[ManagedServer]] = {}
+        ns_owners: dict[tuple[str, str], ManagedServer] = {}
+        # Priority order is preserved so "first server wins" still holds
+        for server in self._get_active_servers_sorted():
+            namespace = server.get_effective_namespace("resources", self.bridge_config.bridge)
+            for uri in server.resource_uri_strs:
+                owners.setdefault(uri, []).append(server)
+                if namespace:
+                    ns_owners.setdefault((namespace, uri), server)
+        self._resource_uri_owners = (self.capability_cache_version, owners)
+        self._resource_ns_owners = (self.capability_cache_version, ns_owners)
+        return owners
+
+    def _get_resource_ns_owners(self) -> dict[tuple[str, str], ManagedServer]:
+        """Return the (namespace, URI) owner index, rebuilding if stale."""
+        cached = self._resource_ns_owners
+        if cached is None or cached[0] != self.capability_cache_version:
+            self._get_resource_uri_owners()  # Rebuilds both indexes
+            cached = self._resource_ns_owners
+        return cached[1] if cached else {}
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> types.CallToolResult:
         """Call a tool by name, routing to the appropriate server."""
-        # Parse namespace from tool name
-        if "__" in tool_name:
-            namespace, actual_tool_name = tool_name.split("__", 1)
-            # Find server that provides this namespaced tool
-            server = None
-            for s in self.get_active_servers():
-                server_namespace = s.get_effective_namespace("tools", self.bridge_config.bridge)
-                if server_namespace == namespace and any(
-                    tool.name == actual_tool_name for tool in s.tools
-                ):
-                    server = s
-                    break
-        else:
-            # No namespace, find first server with this tool
-            server = None
-            actual_tool_name = tool_name
-            for s in self.get_active_servers():
-                if any(tool.name == actual_tool_name for tool in s.tools):
-                    server = s
-                    break
-
-        if not server or not server.session:
+        # O(1) lookup against the prebuilt routing table instead of scanning
+        # every active server's tool list per call
+        owner = self._get_owner_map("tools").get(tool_name)
+        if owner is None or not owner[0].session:
             msg = f"No active server found for tool: {tool_name}"
             raise ValueError(msg)
-
-        # Verify tool exists
-        if not any(tool.name == actual_tool_name for tool in server.tools):
-            msg = f"Tool '{actual_tool_name}' not found on server '{server.name}'"
-            raise ValueError(msg)
+        server, actual_tool_name = owner
 
         # Call the tool
         try:
@@ -707,36 +930,17 @@ class ServerManager:
 
     async def read_resource(self, resource_uri: str) -> types.ReadResourceResult:
         """Read a resource by URI, routing to the appropriate server."""
-        # Parse namespace from URI using our double underscore separator
-        if "__" in resource_uri:
-            namespace, actual_uri = resource_uri.split("__", 1)
-            # Find server that provides this namespaced resource
-            server = None
-            for s in self.get_active_servers():
-                server_namespace = s.get_effective_namespace("resources", self.bridge_config.bridge)
-                if server_namespace == namespace and any(
-                    str(resource.uri) == actual_uri for resource in s.resources
-                ):
-                    server = s
-                    break
-        else:
-            # No namespace, find first server with this resource
-            server = None
-            actual_uri = resource_uri
-            for s in self.get_active_servers():
-                if any(str(resource.uri) == actual_uri for resource in s.resources):
-                    server = s
-                    break
-
-        if not server or not server.session:
+        owner = self._get_owner_map("resources").get(resource_uri)
+        if owner is None or not owner[0].session:
             msg = f"No active server found for resource: {resource_uri}"
             raise ValueError(msg)
+        server, actual_uri = owner
 
         # Call the resource
         try:
             # Try to create a valid URL from the actual URI
             try:
-                resource_url = AnyUrl(actual_uri)
+                resource_url = _parse_url(actual_uri)
             except Exception as url_error:
                 # If the URI is invalid, wrap it in a more informative error
                 msg = (
@@ -768,30 +972,11 @@ class ServerManager:
         arguments: dict[str, str] | None = None,
     ) -> types.GetPromptResult:
         """Get a prompt by name, routing to the appropriate server."""
-        # Parse namespace from prompt name
-        if "__" in prompt_name:
-            namespace, actual_prompt_name = prompt_name.split("__", 1)
-            # Find server that provides this namespaced prompt
-            server = None
-            for s in self.get_active_servers():
-                server_namespace = s.get_effective_namespace("prompts", self.bridge_config.bridge)
-                if server_namespace == namespace and any(
-                    prompt.name == actual_prompt_name for prompt in s.prompts
-                ):
-                    server = s
-                    break
-        else:
-            # No namespace, find first server with this prompt
-            server = None
-            actual_prompt_name = prompt_name
-            for s in self.get_active_servers():
-                if any(prompt.name == actual_prompt_name for prompt in s.prompts):
-                    server = s
-                    break
-
-        if not server or not server.session:
+        owner = self._get_owner_map("prompts").get(prompt_name)
+        if owner is None or not owner[0].session:
             msg = f"No active server found for prompt: {prompt_name}"
             raise ValueError(msg)
+        server, actual_prompt_name = owner
 
         # Call the prompt
         try:
@@ -834,22 +1019,7 @@ class ServerManager:
                     "keep_alive_failures": server.health.keep_alive_failures,
                     "last_keep_alive": server.health.last_keep_alive,
                 },
-                "config": {
-                    "enabled": server.config.enabled,
-                    "command": server.config.command,
-                    "args": server.config.args,
-                    "priority": server.config.priority,
-                    "tags": server.config.tags,
-                    "health_check_enabled": server.config.health_check.enabled
-                    if server.config.health_check
-                    else False,
-                    "health_check_operation": server.config.health_check.operation
-                    if server.config.health_check
-                    else "list_tools",
-                    "auto_restart": server.config.health_check.auto_restart
-                    if server.config.health_check
-                    else False,
-                },
+                "config": server.get_status_config(),
             }
         return status
 
@@ -860,52 +1030,56 @@ class ServerManager:
         # Parse namespace from URI to find target server
         if "://" in resource_uri:
             namespace, actual_uri = resource_uri.split("://", 1)
-            # Find server that provides this namespaced resource
-            for server in self.get_active_servers():
-                server_namespace = server.get_effective_namespace(
-                    "resources", self.bridge_config.bridge
-                )
-                if server_namespace == namespace and any(
-                    resource.uri == actual_uri for resource in server.resources
-                ):
-                    if server.session:
-                        try:
-                            await server.session.subscribe_resource(AnyUrl(actual_uri))
-                            logger.debug(
-                                "Subscribed to resource '%s' on server '%s'",
-                                actual_uri,
-                                server.name,
-                            )
-                        except Exception:
-                            logger.exception(
-                                "Failed to subscribe to resource '%s' on server '%s'",
-                                actual_uri,
-                                server.name,
-                            )
-                    break
+            # Resolve the owning server with a single indexed lookup
+            server = self._get_resource_ns_owners().get((namespace, actual_uri))
+            if server and server.session:
+                try:
+                    await server.session.subscribe_resource(_parse_url(actual_uri))
+                    logger.debug(
+                        "Subscribed to resource '%s' on server '%s'",
+                        actual_uri,
+                        server.name,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Failed to subscribe to resource '%s' on server '%s'",
+                        actual_uri,
+                        server.name,
+                    )
         else:
-            # No namespace, subscribe on all servers that have this resource
+            # No namespace; fan out concurrently to all servers that have
+            # this resource so latency is one RTT rather than the sum
             actual_uri = resource_uri
+            parsed_uri = _parse_url(actual_uri)
+            servers = [
+                server
+                for server in self._get_resource_uri_owners().get(actual_uri, [])
+                if server.session
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._bounded_fanout(server.session.subscribe_resource(parsed_uri))  # type: ignore[union-attr]
+                    for server in servers
+                ),
+                return_exceptions=True,
+            )
+
             subscribed_count = 0
-            for server in self.get_active_servers():
-                if (
-                    any(resource.uri == actual_uri for resource in server.resources)
-                    and server.session
-                ):
-                    try:
-                        await server.session.subscribe_resource(AnyUrl(actual_uri))
-                        logger.debug(
-                            "Subscribed to resource '%s' on server '%s'",
-                            actual_uri,
-                            server.name,
-                        )
-                        subscribed_count += 1
-                    except Exception:
-                        logger.exception(
-                            "Failed to subscribe to resource '%s' on server '%s'",
-                            actual_uri,
-                            server.name,
-                        )
+            for server, result in zip(servers, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Failed to subscribe to resource '%s' on server '%s': %s",
+                        actual_uri,
+                        server.name,
+                        result,
+                    )
+                    continue
+                logger.debug(
+                    "Subscribed to resource '%s' on server '%s'",
+                    actual_uri,
+                    server.name,
+                )
+                subscribed_count += 1
 
             if subscribed_count == 0:
                 logger.warning("No servers found with resource: %s", resource_uri)
@@ -917,52 +1091,56 @@ class ServerManager:
         # Parse namespace from URI to find target server
         if "://" in resource_uri:
             namespace, actual_uri = resource_uri.split("://", 1)
-            # Find server that provides this namespaced resource
-            for server in self.get_active_servers():
-                server_namespace = server.get_effective_namespace(
-                    "resources", self.bridge_config.bridge
-                )
-                if server_namespace == namespace and any(
-                    resource.uri == actual_uri for resource in server.resources
-                ):
-                    if server.session:
-                        try:
-                            await server.session.unsubscribe_resource(AnyUrl(actual_uri))
-                            logger.debug(
-                                "Unsubscribed from resource '%s' on server '%s'",
-                                actual_uri,
-                                server.name,
-                            )
-                        except Exception:
-                            logger.exception(
-                                "Failed to unsubscribe from resource '%s' on server '%s'",
-                                actual_uri,
-                                server.name,
-                            )
-                    break
+            # Resolve the owning server with a single indexed lookup
+            server = self._get_resource_ns_owners().get((namespace, actual_uri))
+            if server and server.session:
+                try:
+                    await server.session.unsubscribe_resource(_parse_url(actual_uri))
+                    logger.debug(
+                        "Unsubscribed from resource '%s' on server '%s'",
+                        actual_uri,
+                        server.name,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Failed to unsubscribe from resource '%s' on server '%s'",
+                        actual_uri,
+                        server.name,
+                    )
         else:
-            # No namespace, unsubscribe from all servers that have this resource
+            # No namespace; fan out concurrently to all servers that have
+            # this resource so latency is one RTT rather than the sum
             actual_uri = resource_uri
+            parsed_uri = _parse_url(actual_uri)
+            servers = [
+                server
+                for server in self._get_resource_uri_owners().get(actual_uri, [])
+                if server.session
+            ]
+            results = await asyncio.gather(
+                *(
+                    self._bounded_fanout(server.session.unsubscribe_resource(parsed_uri))  # type: ignore[union-attr]
+                    for server in servers
+                ),
+                return_exceptions=True,
+            )
+
             unsubscribed_count = 0
-            for server in self.get_active_servers():
-                if (
-                    any(resource.uri == actual_uri for resource in server.resources)
-                    and server.session
-                ):
-                    try:
-                        await server.session.unsubscribe_resource(AnyUrl(actual_uri))
-                        logger.debug(
-                            "Unsubscribed from resource '%s' on server '%s'",
-                            actual_uri,
-                            server.name,
-                        )
-                        unsubscribed_count += 1
-                    except Exception:
-                        logger.exception(
-                            "Failed to unsubscribe from resource '%s' on server '%s'",
-                            actual_uri,
-                            server.name,
-                        )
+            for server, result in zip(servers, results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Failed to unsubscribe from resource '%s' on server '%s': %s",
+                        actual_uri,
+                        server.name,
+                        result,
+                    )
+                    continue
+                logger.debug(
+                    "Unsubscribed from resource '%s' on server '%s'",
+                    actual_uri,
+                    server.name,
+                )
+                unsubscribed_count += 1
 
             if unsubscribed_count == 0:
                 logger.warning("No servers found with resource: %s", resource_uri)
@@ -971,19 +1149,30 @@ class ServerManager:
         """Set logging level on all active managed servers."""
         logger.debug("Setting logging level to %s on all managed servers", level)
 
+        # Fan out concurrently so total latency is one round trip
+        servers = [server for server in self.get_active_servers() if server.session]
+        results = await asyncio.gather(
+            *(
+                self._bounded_fanout(server.session.set_logging_level(level))  # type: ignore[union-attr]
+                for server in servers
+            ),
+            return_exceptions=True,
+        )
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         forwarded_count = 0
-        for server in self.get_active_servers():
-            if server.session:
-                try:
-                    await server.session.set_logging_level(level)
-                    logger.debug("Set logging level to %s on server '%s'", level, server.name)
-                    forwarded_count += 1
-                except Exception:
-                    logger.exception(
-                        "Failed to set logging level to %s on server '%s'",
-                        level,
-                        server.name,
-                    )
+        for server, result in zip(servers, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to set logging level to %s on server '%s': %s",
+                    level,
+                    server.name,
+                    result,
+                )
+                continue
+            if debug_enabled:
+                logger.debug("Set logging level to %s on server '%s'", level, server.name)
+            forwarded_count += 1
 
         logger.info("Forwarded logging level %s to %d servers", level, forwarded_count)
 
@@ -995,74 +1184,54 @@ class ServerManager:
         """Get completions from all active managed servers and aggregate them."""
         logger.debug("Getting completions for ref: %s", ref)
 
-        all_completions = []
-
-        for server in self.get_active_servers():
-            if server.session:
-                try:
-                    # Convert CompletionArgument to dict[str, str] format for session.complete
-                    argument_dict = {}
-                    if hasattr(argument, "name") and hasattr(argument, "value"):
-                        argument_dict[argument.name] = argument.value
-
-                    # Call the server's completion endpoint
-                    result = await server.session.complete(ref, argument_dict)
-                    if result.completion and result.completion.values:
-                        server_completions = result.completion.values
-                        logger.debug(
-                            "Got %d completions from server '%s'",
-                            len(server_completions),
-                            server.name,
-                        )
-                        all_completions.extend(server_completions)
+        # Convert CompletionArgument to dict[str, str] format for session.complete
+        argument_dict = {}
+        if hasattr(argument, "name") and hasattr(argument, "value"):
+            argument_dict[argument.name] = argument.value
+
+        # Fan out to all servers concurrently so total latency is the slowest
+        # server, not the sum of all of them.
+        servers = [server for server in self.get_active_servers() if server.session]
+        results = await asyncio.gather(
+            *(
+                self._bounded_fanout(server.session.complete(ref, argument_dict))  # type: ignore[union-attr]
+                for server in servers
+            ),
+            return_exceptions=True,
+        )
 
-                except Exception:
-                    logger.exception(
-                        "Failed to get completions from server '%s'",
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        all_completions = []
+        for server, result in zip(servers, results, strict=True):
+            if isinstance(result, BaseException):
+                if debug_enabled:
+                    logger.debug(
+                        "Failed to get completions from server '%s': %s",
                         server.name,
+                        result,
                     )
+                continue
+            if result.completion and result.completion.values:
+                server_completions = result.completion.values
+                if debug_enabled:
+                    logger.debug(
+                        "Got %d completions from server '%s'",
+                        len(server_completions),
+                        server.name,
+                    )
+                all_completions.extend(server_completions)
 
-        # Remove duplicates while preserving order
-        unique_completions = []
-        seen = set()
-        for completion in all_completions:
-            if completion not in seen:
-                seen.add(completion)
-                unique_completions.append(completion)
+        # Remove duplicates while preserving order; dict.fromkeys runs in C
+        unique_completions = list(dict.fromkeys(all_completions))
 
         logger.debug(
             "Aggregated %d unique completions from %d servers",
             len(unique_completions),
-            len(self.get_active_servers()),
+            len(servers),
         )
 
         return unique_completions
 
-    async def _perform_keep_alive_checks(self) -> None:
-        """Perform keep-alive checks on all connected servers."""
-        current_time = time.time()
-
-        for server in self.servers.values():
-            if (
-                server.health.status != ServerStatus.CONNECTED
-                or not server.session
-                or not server.config.health_check
-                or not server.config.health_check.enabled
-            ):
-                continue
-
-            # Check if it's time for a keep-alive ping
-            time_since_last_keep_alive = current_time - server.health.last_keep_alive
-            keep_alive_interval = server.config.health_check.keep_alive_interval / 1000.0
-
-            if time_since_last_keep_alive >= keep_alive_interval:
-                # Start keep-alive task and store reference to prevent GC
-                keep_alive_task = asyncio.create_task(self._send_keep_alive(server))
-                if not hasattr(self, "_keep_alive_tasks"):
-                    self._keep_alive_tasks = set()
-                self._keep_alive_tasks.add(keep_alive_task)
-                keep_alive_task.add_done_callback(self._keep_alive_tasks.discard)
-
     async def _send_keep_alive(self, server: ManagedServer) -> None:
         """Send a keep-alive ping to a specific server."""
         if not server.session or not server.config.health_check:
@@ -1107,18 +1276,14 @@ class ServerManager:
                 ):
                     # Start restart task and store reference to prevent GC
                     restart_task = asyncio.create_task(self._restart_server(server))
-                    if not hasattr(self, "_restart_tasks"):
-                        self._restart_tasks = set()
                     self._restart_tasks.add(restart_task)
                     restart_task.add_done_callback(self._restart_tasks.discard)
 
     async def _restart_server(self, server: ManagedServer) -> None:
         """Restart a failed server."""
-        # Prevent multiple simultaneous restart attempts
-        if server.name not in self._restart_locks:
-            self._restart_locks[server.name] = asyncio.Lock()
-
-        async with self._restart_locks[server.name]:
+        # Prevent multiple simultaneous restart attempts; locks are created
+        # lazily since restarts are rare
+        async with self._restart_locks.setdefault(server.name, asyncio.Lock()):
             if server.health.status != ServerStatus.FAILED:
                 return  # Server recovered while we were waiting for lock
 
@@ -1174,9 +1339,11 @@ class ServerManager:
         """
         logger.info("Updating server configurations...")
 
-        # Get current server names and new server names (normalized)
+        # Get current server names and new server names (normalized); the
+        # reverse map lets the add/update loops avoid re-normalizing per pair
         current_names = set(self.servers.keys())
-        new_names = {normalize_server_name(name) for name in new_server_configs}
+        norm_to_orig = {normalize_server_name(name): name for name in new_server_configs}
+        new_names = set(norm_to_orig)
 
         # Determine what changes need to be made
         servers_to_add = new_names - current_names
@@ -1190,40 +1357,50 @@ class ServerManager:
             len(servers_to_check_update),
         )
 
+        # Each phase runs concurrently under the fan-out semaphore while
+        # preserving remove-before-add-before-update ordering between phases.
         # Remove servers that are no longer in configuration
-        for server_name in servers_to_remove:
-            await self._remove_server(server_name)
+        await self._gather_update_phase(
+            "remove",
+            [self._remove_server(name) for name in servers_to_remove],
+        )
 
         # Add new servers (need to find original config name from normalized name)
+        add_ops = []
         for normalized_name in servers_to_add:
-            # Find the original config name that normalizes to this name
-            original_name = None
-            for orig_name in new_server_configs:
-                if normalize_server_name(orig_name) == normalized_name:
-                    original_name = orig_name
-                    break
+            original_name = norm_to_orig.get(normalized_name)
             if original_name:
                 config = new_server_configs[original_name]
-                await self._add_server(original_name, config)
+                add_ops.append(self._add_server(original_name, config))
+        await self._gather_update_phase("add", add_ops)
 
         # Check for configuration updates on existing servers
+        update_ops = []
         for normalized_name in servers_to_check_update:
-            # Find the original config name that normalizes to this name
-            original_name = None
-            for orig_name in new_server_configs:
-                if normalize_server_name(orig_name) == normalized_name:
-                    original_name = orig_name
-                    break
+            original_name = norm_to_orig.get(normalized_name)
             if original_name:
                 old_config = self.servers[normalized_name].config
                 new_config = new_server_configs[original_name]
 
                 if self._server_config_changed(old_config, new_config):
                     logger.info("Configuration changed for server '%s', updating...", original_name)
-                    await self._update_server(original_name, new_config)
+                    update_ops.append(self._update_server(original_name, new_config))
+        await self._gather_update_phase("update", update_ops)
 
         logger.info("Server configuration update completed")
 
+    async def _gather_update_phase(self, phase: str, ops: list[Awaitable[None]]) -> None:
+        """Run one update_servers phase concurrently, logging any failures."""
+        if not ops:
+            return
+        results = await asyncio.gather(
+            *(self._bounded_fanout(op) for op in ops),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Server %s operation failed: %s", phase, result)
+
     async def _add_server(self, name: str, config: BridgeServerConfig) -> None:
         """Add a new server to the manager."""
         if not config.enabled:
@@ -1236,7 +1413,8 @@ class ServerManager:
         normalized_name = normalize_server_name(name)
         managed_server = ManagedServer(name=normalized_name, config=config)
         self.servers[normalized_name] = managed_server
-        self._restart_locks[normalized_name] = asyncio.Lock()
+        self._name_aliases[name] = normalized_name
+        self._name_aliases[normalized_name] = normalized_name
 
         # Connect to the server
         await self._connect_server(managed_server)
@@ -1254,10 +1432,18 @@ class ServerManager:
             # Disconnect the server
             await self._disconnect_server(server)
 
-            # Remove from tracking
+            # Remove from tracking. The log-level memo entry must go too:
+            # it is keyed by config object identity, and a recycled id()
+            # could hand this server's cached level to a future server.
             del self.servers[normalized_name]
+            self._log_level_cache.pop(id(server.config), None)
             if normalized_name in self._restart_locks:
                 del self._restart_locks[normalized_name]
+            self._name_aliases = {
+                alias: canonical
+                for alias, canonical in self._name_aliases.items()
+                if canonical != normalized_name
+            }
 
         logger.info("Successfully removed server '%s'", name)
 
@@ -1272,6 +1458,11 @@ class ServerManager:
 
         logger.info("Updating configuration for server '%s'", name)
 
+        # Any config change may alter namespacing or log levels; recompute
+        # lazily and drop identity-keyed memos so stale ids cannot collide
+        server.invalidate_namespace_cache()
+        self._log_level_cache.clear()
+
         # If the server is becoming disabled, just disconnect it
         if not new_config.enabled:
             await self._disconnect_server(server)
@@ -1299,6 +1490,10 @@ class ServerManager:
         else:
             # For other config changes (priority, health check, etc.), just update config
             server.config = new_config
+            # No reconnect happens on this path, so invalidate the
+            # version-keyed caches explicitly: priority, namespaces and
+            # conflict settings all feed the aggregated views
+            self.bump_cache_version()
 
             # Re-validate health check configuration
             if server.session and server.health.capabilities:
@@ -1310,6 +1505,10 @@ class ServerManager:
         self, old_config: BridgeServerConfig, new_config: BridgeServerConfig
     ) -> bool:
         """Check if server configuration has meaningfully changed."""
+        # Unequal fingerprints always mean a real change; equal fingerprints
+        # fall through to the exact comparison to rule out hash collisions
+        if old_config.change_fingerprint() != new_config.change_fingerprint():
+            return True
         # Check key fields that would require action
         return (
             old_config.enabled != new_config.enabled
@@ -1325,86 +1524,88 @@ class ServerManager:
             or old_config.tags != new_config.tags
         )
 
-    async def _execute_health_check_operation(self, server: ManagedServer) -> None:
-        """Execute the configured health check operation for a server."""
-        if not server.session:
-            msg = f"No session available for server '{server.name}'"
-            raise RuntimeError(msg)
+    async def _hc_list_tools(self, _server: ManagedServer, session: ClientSession) -> None:
+        """Health check via tool listing."""
+        await session.list_tools()
 
-        if not server.config.health_check:
-            # Fallback to default operation
-            await server.session.list_tools()
-            return
+    async def _hc_list_resources(self, _server: ManagedServer, session: ClientSession) -> None:
+        """Health check via resource listing."""
+        await session.list_resources()
 
-        operation = server.config.health_check.operation.lower()
-        session = server.session
+    async def _hc_list_prompts(self, _server: ManagedServer, session: ClientSession) -> None:
+        """Health check via prompt listing."""
+        await session.list_prompts()
 
-        try:
-            if operation == "list_tools":
-                await session.list_tools()
-            elif operation == "list_resources":
-                await session.list_resources()
-            elif operation == "list_prompts":
-                await session.list_prompts()
-            elif operation == "call_tool":
-                if not server.config.health_check.tool_name:
-                    logger.warning(
-                        "Health check operation 'call_tool' requires 'toolName' for server '%s', "
-                        "falling back to list_tools",
-                        server.name,
-                    )
-                    await session.list_tools()
-                    return
+    async def _hc_ping(self, _server: ManagedServer, session: ClientSession) -> None:
+        """Health check via a protocol-level ping round trip."""
+        await session.send_ping()
 
-                tool_args = server.config.health_check.tool_arguments or {}
-                await session.call_tool(server.config.health_check.tool_name, tool_args)
+    async def _hc_call_tool(self, server: ManagedServer, session: ClientSession) -> None:
+        """Health check via a configured tool invocation."""
+        health_check = server.config.health_check
+        if not health_check or not health_check.tool_name:
+            logger.warning(
+                "Health check operation 'call_tool' requires 'toolName' for server '%s', "
+                "falling back to list_tools",
+                server.name,
+            )
+            await session.list_tools()
+            return
 
-            elif operation == "read_resource":
-                if not server.config.health_check.resource_uri:
-                    logger.warning(
-                        "Health check operation 'read_resource' requires 'resourceUri' for "
-                        "server '%s', falling back to list_tools",
-                        server.name,
-                    )
-                    await session.list_tools()
-                    return
+        await session.call_tool(health_check.tool_name, health_check.tool_arguments or {})
 
-                await session.read_resource(AnyUrl(server.config.health_check.resource_uri))
+    async def _hc_read_resource(self, server: ManagedServer, session: ClientSession) -> None:
+        """Health check via a configured resource read."""
+        health_check = server.config.health_check
+        if not health_check or not health_check.resource_uri:
+            logger.warning(
+                "Health check operation 'read_resource' requires 'resourceUri' for "
+                "server '%s', falling back to list_tools",
+                server.name,
+            )
+            await session.list_tools()
+            return
 
-            elif operation == "get_prompt":
-                if not server.config.health_check.prompt_name:
-                    logger.warning(
-                        "Health check operation 'get_prompt' requires 'promptName' for "
-                        "server '%s', falling back to list_tools",
-                        server.name,
-                    )
-                    await session.list_tools()
-                    return
+        await session.read_resource(_parse_url(health_check.resource_uri))
 
-                prompt_args = server.config.health_check.prompt_arguments
-                await session.get_prompt(server.config.health_check.prompt_name, prompt_args)
+    async def _hc_get_prompt(self, server: ManagedServer, session: ClientSession) -> None:
+        """Health check via a configured prompt fetch."""
+        health_check = server.config.health_check
+        if not health_check or not health_check.prompt_name:
+            logger.warning(
+                "Health check operation 'get_prompt' requires 'promptName' for "
+                "server '%s', falling back to list_tools",
+                server.name,
+            )
+            await session.list_tools()
+            return
 
-            elif operation in ["ping", "health", "status"]:
-                # For common health check operations, try to use a ping if available
-                # Fall back to list_tools if no specific ping operation exists
-                try:
-                    # Some servers might have a dedicated ping/health operation
-                    if hasattr(session, "ping"):
-                        await session.ping()
-                    else:
-                        await session.list_tools()
-                except AttributeError:
-                    await session.list_tools()
+        await session.get_prompt(health_check.prompt_name, health_check.prompt_arguments)
 
-            else:
-                logger.warning(
-                    "Unknown health check operation '%s' for server '%s', "
-                    "falling back to list_tools",
-                    operation,
-                    server.name,
-                )
-                await session.list_tools()
+    async def _execute_health_check_operation(self, server: ManagedServer) -> None:
+        """Execute the configured health check operation for a server."""
+        if not server.session:
+            msg = f"No session available for server '{server.name}'"
+            raise RuntimeError(msg)
+
+        if not server.config.health_check:
+            # Fallback to the lightweight default operation
+            await server.session.send_ping()
+            return
 
+        # Operation names are lowercased once at config load
+        operation = server.config.health_check.operation
+        handler = self._hc_ops.get(operation)
+        if handler is None:
+            logger.warning(
+                "Unknown health check operation '%s' for server '%s', falling back to list_tools",
+                operation,
+                server.name,
+            )
+            handler = self._hc_list_tools
+
+        try:
+            await handler(server, server.session)
         except Exception as e:
             # Log the specific operation that failed for debugging
             logger.debug(
@@ -18,22 +18,55 @@
 #
 """Enhanced stdio client wrapper that adds server name prefixes to stdout/stderr logs."""
 
+from __future__ import annotations
+
+import functools
 import logging
+import re
+import subprocess
 import sys
-from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import TextIO
+from typing import TYPE_CHECKING, TextIO
 
 import anyio
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from anyio.streams.text import TextReceiveStream
 from mcp.client.stdio import StdioServerParameters, stdio_client
-from mcp.shared.message import SessionMessage
 from rich.console import Console
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+    from mcp.shared.message import SessionMessage
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _server_logger(server_name: str, suffix: str = "") -> logging.Logger:
+    """Return the per-server logger, memoized to skip the logger-tree walk."""
+    return logging.getLogger(f"mcp_foxxy_bridge.servers.{server_name}{suffix}")
+
+
+# Single-pass level classifier for raw server output: the first marker found
+# keys into _LEVEL_BY_MARKER; lines without a marker log at INFO.
+_LEVEL_RE = re.compile(r"error|exception|traceback|warn|debug|trace", re.IGNORECASE)
+_LEVEL_BY_MARKER = {
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "traceback": logging.ERROR,
+    "warn": logging.WARNING,
+    "debug": logging.DEBUG,
+    "trace": logging.DEBUG,
+}
+
+# Shared `extra` dict for Rich markup; read-only, so one instance serves
+# every record instead of allocating a fresh dict per log call.
+_MARKUP_EXTRA = {"markup": True}
+
+# First byte of a JSON-RPC frame, for cheap rejection of plain output lines.
+_LBRACE = ord("{")
+
+
 class PrefixedLogHandler:
     """Handles stderr output with server name prefixes."""
 
@@ -46,33 +79,60 @@ class PrefixedLogHandler:
         """
         self.server_name = server_name
         self.original_errlog = original_errlog
-        self.logger = logging.getLogger(f"mcp_foxxy_bridge.servers.{server_name}")
+        self.logger = _server_logger(server_name)
         self.console = Console(stderr=True, force_terminal=True)
+        # Hot-path bindings resolved once so write() skips the repeated
+        # attribute lookups and prefix formatting on every stderr line.
+        self._is_enabled_for = self.logger.isEnabledFor
+        self._make_record = self.logger.makeRecord
+        self._handle = self.logger.handle
+        self._fmt = f"[bold cyan]{server_name}[/bold cyan] %s"
+        # Stream-protocol capabilities of the wrapped stream, resolved once
+        # so the shim methods below avoid per-call hasattr probes.
+        self._flush = getattr(original_errlog, "flush", None)
+        self._close = getattr(original_errlog, "close", None)
+        self._readable = getattr(original_errlog, "readable", None)
+        self._writable = getattr(original_errlog, "writable", None)
+        self._seekable = getattr(original_errlog, "seekable", None)
 
     def write(self, message: str) -> None:
         """Write message with server name prefix and Rich formatting."""
-        if message.strip():  # Only log non-empty messages
-            # Remove trailing newlines for clean logging
-            clean_message = message.rstrip("\n\r")
-            if clean_message:
-                # Create rich formatted message with server name highlighting
-                formatted_message = f"[bold cyan]{self.server_name}[/bold cyan] {clean_message}"
-
-                # Use info level for stdout-like content, debug for verbose output
-                error_markers = ["error", "exception", "traceback"]
-                if any(marker in clean_message.lower() for marker in error_markers):
-                    self.logger.error(formatted_message, extra={"markup": True})
-                elif any(marker in clean_message.lower() for marker in ["warn", "warning"]):
-                    self.logger.warning(formatted_message, extra={"markup": True})
-                elif any(marker in clean_message.lower() for marker in ["debug", "trace"]):
-                    self.logger.debug(formatted_message, extra={"markup": True})
-                else:
-                    self.logger.info(formatted_message, extra={"markup": True})
+        # ERROR is the highest level this handler ever emits at, so if the
+        # logger is disabled even for that, skip all string work outright.
+        if not self._is_enabled_for(logging.ERROR):
+            return
+        # isspace() bails on the first non-space byte without allocating,
+        # unlike the strip() copy this replaces
+        if message and not message.isspace():  # Only log non-empty messages
+            # Remove trailing whitespace for clean logging; the guard above
+            # proved a non-whitespace character exists, so the result is
+            # always truthy
+            clean_message = message.rstrip()
+            # Classify with a single compiled-regex scan; info level for
+            # stdout-like content, debug for verbose output
+            match = _LEVEL_RE.search(clean_message)
+            level = _LEVEL_BY_MARKER[match.group(0).lower()] if match else logging.INFO
+            if self._is_enabled_for(level):
+                # Build the record directly: Logger.log would walk the call
+                # stack in findCaller for every line, which this handler
+                # never needs. The %-args defer the prefix join until a
+                # handler actually formats the record.
+                record = self._make_record(
+                    self.logger.name,
+                    level,
+                    __file__,
+                    0,
+                    self._fmt,
+                    (clean_message,),
+                    None,
+                    extra=_MARKUP_EXTRA,
+                )
+                self._handle(record)
 
     def flush(self) -> None:
         """Flush the original error log."""
-        if hasattr(self.original_errlog, "flush"):
-            self.original_errlog.flush()
+        if self._flush is not None:
+            self._flush()
 
     def fileno(self) -> int:
         """Return the file descriptor of the underlying stream."""
@@ -80,20 +140,20 @@ class PrefixedLogHandler:
 
     def close(self) -> None:
         """Close the underlying stream."""
-        if hasattr(self.original_errlog, "close"):
-            self.original_errlog.close()
+        if self._close is not None:
+            self._close()
 
     def readable(self) -> bool:
         """Return whether the stream supports reading."""
-        return hasattr(self.original_errlog, "readable") and self.original_errlog.readable()
+        return self._readable() if self._readable is not None else False
 
     def writable(self) -> bool:
         """Return whether the stream supports writing."""
-        return hasattr(self.original_errlog, "writable") and self.original_errlog.writable()
+        return self._writable() if self._writable is not None else False
 
     def seekable(self) -> bool:
         """Return whether the stream supports seeking."""
-        return hasattr(self.original_errlog, "seekable") and self.original_errlog.seekable()
+        return self._seekable() if self._seekable is not None else False
 
 
 class StdoutCaptureHandler:
@@ -106,8 +166,60 @@ class StdoutCaptureHandler:
             server_name: Name of the server to use as prefix
         """
         self.server_name = server_name
-        self.logger = logging.getLogger(f"mcp_foxxy_bridge.servers.{server_name}.stdout")
+        self.logger = _server_logger(server_name, ".stdout")
         self.console = Console(stderr=True, force_terminal=True)
+        # Prebuilt %-formats so per-line calls defer prefix formatting to
+        # whichever handler actually emits the record.
+        self._fmt = f"[bold cyan]{server_name}[/bold cyan] %s"
+        self._fmt_mcp = f"[bold cyan]{server_name}[/bold cyan] [dim]MCP:[/dim] %s"
+
+    def _log_lines(self, raw_lines: list[bytes]) -> None:
+        """Classify and log a batch of captured lines; runs on a worker thread.
+
+        Consecutive application-output lines coalesce into a single record so
+        the logging lock and handler walk are paid once per run, not per line.
+        JSON-RPC frames stay one record each at debug level.
+        """
+        info_enabled = self.logger.isEnabledFor(logging.INFO)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        plain: list[str] = []
+        for raw_line in raw_lines:
+            stripped = raw_line.strip()
+            if not stripped:  # Only log non-empty lines
+                continue
+            # MCP frames open with { and carry the jsonrpc key near the
+            # start, so a single-byte compare rejects plain output lines
+            # before the bounded search; neither step allocates a slice.
+            # Skipped lines are never decoded: UTF-8 sequences cannot span
+            # a newline, so per-line decoding is safe.
+            if stripped[0] == _LBRACE and stripped.find(b'"jsonrpc"', 0, 96) != -1:
+                if plain:
+                    # Flush the pending run first to preserve ordering
+                    self.logger.info(self._fmt, "\n".join(plain), extra=_MARKUP_EXTRA)
+                    plain.clear()
+                if debug_enabled:
+                    # This is likely MCP protocol traffic, log at debug level
+                    line = stripped.decode("utf-8", errors="replace").strip()
+                    self.logger.debug(self._fmt_mcp, line, extra=_MARKUP_EXTRA)
+            elif info_enabled:
+                # This is likely application output, log at info level
+                plain.append(stripped.decode("utf-8", errors="replace").strip())
+        if plain:
+            self.logger.info(self._fmt, "\n".join(plain), extra=_MARKUP_EXTRA)
+
+    async def _pump_chunks(
+        self,
+        stdout_stream: anyio.abc.ByteReceiveStream,
+        send_stream: MemoryObjectSendStream[bytes],
+    ) -> None:
+        """Drain the subprocess pipe into the channel ahead of log handling."""
+        try:
+            async with send_stream:
+                async for chunk in stdout_stream:
+                    await send_stream.send(chunk)
+        except anyio.ClosedResourceError:
+            # Stream was closed, normal during shutdown
+            self.logger.debug(self._fmt, "[dim]Stdout stream closed[/dim]", extra=_MARKUP_EXTRA)
 
     async def capture_stdout(self, stdout_stream: anyio.abc.ByteReceiveStream) -> None:
         """Capture stdout and log with server prefix.
@@ -116,44 +228,47 @@ class StdoutCaptureHandler:
             stdout_stream: The stdout stream from the MCP server process
         """
         try:
-            buffer = ""
-            async for chunk in TextReceiveStream(stdout_stream, encoding="utf-8", errors="replace"):
-                lines = (buffer + chunk).split("\n")
-                buffer = lines.pop()
-
-                for line in lines:
-                    if line.strip():  # Only log non-empty lines
-                        # Check if this looks like a JSON-RPC message (MCP protocol)
-                        if line.strip().startswith('{"') and '"jsonrpc"' in line:
-                            # This is likely MCP protocol traffic, log at debug level
-                            formatted_msg = (
-                                f"[bold cyan]{self.server_name}[/bold cyan] "
-                                f"[dim]MCP:[/dim] {line.strip()}"
-                            )
-                            self.logger.debug(formatted_msg, extra={"markup": True})
-                        else:
-                            # This is likely application output, log at info level
-                            formatted_msg = (
-                                f"[bold cyan]{self.server_name}[/bold cyan] {line.strip()}"
-                            )
-                            self.logger.info(formatted_msg, extra={"markup": True})
-
-                # Handle any remaining content in buffer
-                if buffer.strip():
-                    formatted_msg = f"[bold cyan]{self.server_name}[/bold cyan] {buffer.strip()}"
-                    self.logger.info(formatted_msg, extra={"markup": True})
-
-        except anyio.ClosedResourceError:
-            # Stream was closed, normal during shutdown
-            formatted_msg = (
-                f"[bold cyan]{self.server_name}[/bold cyan] [dim]Stdout stream closed[/dim]"
+            # A small bounded channel lets the pump keep draining the pipe
+            # while slow log handlers flush, so the child process does not
+            # block on a full pipe buffer.
+            send_stream, receive_stream = anyio.create_memory_object_stream[bytes](
+                max_buffer_size=4,
             )
-            self.logger.debug(formatted_msg, extra={"markup": True})
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(self._pump_chunks, stdout_stream, send_stream)
+
+                # Accumulate raw bytes and slice complete lines out in place
+                # so previously scanned content is never recopied or re-split.
+                buf = bytearray()
+                async with receive_stream:
+                    async for chunk in receive_stream:
+                        buf.extend(chunk)
+                        start = 0
+                        lines: list[bytes] = []
+                        while (newline := buf.find(b"\n", start)) != -1:
+                            lines.append(bytes(buf[start:newline]))
+                            start = newline + 1
+                        if start:
+                            del buf[:start]
+                        if lines:
+                            # Classify and emit on a worker thread so slow
+                            # log handlers cannot stall the event loop; the
+                            # pump keeps draining the pipe meanwhile.
+                            await anyio.to_thread.run_sync(self._log_lines, lines)
+
+                    # Flush an unterminated tail only once the stream ends;
+                    # flushing inside the loop would log partial lines that
+                    # get logged again when the newline finally arrives.
+                    if buf.strip():
+                        tail = buf.decode("utf-8", errors="replace").strip()
+                        self.logger.info(self._fmt, tail, extra=_MARKUP_EXTRA)
+
         except Exception:
-            formatted_msg = (
-                f"[bold cyan]{self.server_name}[/bold cyan] [red]Error capturing stdout[/red]"
+            self.logger.exception(
+                self._fmt,
+                "[red]Error capturing stdout[/red]",
+                extra=_MARKUP_EXTRA,
             )
-            self.logger.exception(formatted_msg, extra={"markup": True})
 
 
 @asynccontextmanager
@@ -188,15 +303,23 @@ async def stdio_client_with_logging(
     """
     logger.debug("Starting stdio client with logging for server: %s", server_name)
 
-    # Create a prefixed error log handler
-    prefixed_errlog = PrefixedLogHandler(server_name, errlog)
-
     # Set the log level for this server's logger
-    server_logger = logging.getLogger(f"mcp_foxxy_bridge.servers.{server_name}")
+    server_logger = _server_logger(server_name)
     numeric_level = getattr(logging, log_level.upper(), logging.ERROR)
     server_logger.setLevel(numeric_level)
     logger.debug("Set log level for server '%s' to: %s", server_name, log_level)
 
+    # The handler never logs above ERROR, so when the server logger sits
+    # beyond that nothing could ever emit; suppress child stderr with a null
+    # sink (anyio.open_process forwards it to the subprocess verbatim) and
+    # skip the per-line wrapper entirely.
+    prefixed_errlog: int | PrefixedLogHandler
+    if numeric_level > logging.ERROR:
+        prefixed_errlog = subprocess.DEVNULL
+    else:
+        # Create a prefixed error log handler
+        prefixed_errlog = PrefixedLogHandler(server_name, errlog)
+
     # For quiet servers (ERROR level), modify the server to redirect stdout to /dev/null
     if log_level.upper() == "ERROR":
         # Create modified server parameters for quiet operation
@@ -10,7 +10,7 @@ The same test code is run on both to ensure parity.
 """
 
 import typing as t
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from unittest.mock import AsyncMock
 
@@ -55,6 +55,68 @@ def server() -> Server[object]:
     return Server("test-server")
 
 
+# Callback mocks shared across tests: constructing an AsyncMock is
+# comparatively expensive, and building them inside parametrize lists
+# recreated them at collection time. One instance per callback is created
+# here and reset after each test by its fixture.
+_tool_mock = AsyncMock()
+_logging_level_mock = AsyncMock()
+_prompt_mock = AsyncMock()
+_resource_mock = AsyncMock()
+_subscribe_mock = AsyncMock()
+_unsubscribe_mock = AsyncMock()
+_complete_mock = AsyncMock()
+
+
+@pytest.fixture
+def tool() -> Generator[AsyncMock, None, None]:
+    """Yield the shared tool callback mock, reset after the test."""
+    yield _tool_mock
+    _tool_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def logging_level_callback() -> Generator[AsyncMock, None, None]:
+    """Yield the shared logging-level callback mock, reset after the test."""
+    yield _logging_level_mock
+    _logging_level_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def prompt_callback() -> Generator[AsyncMock, None, None]:
+    """Yield the shared prompt callback mock, reset after the test."""
+    yield _prompt_mock
+    _prompt_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def resource_callback() -> Generator[AsyncMock, None, None]:
+    """Yield the shared resource callback mock, reset after the test."""
+    yield _resource_mock
+    _resource_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def subscribe_callback() -> Generator[AsyncMock, None, None]:
+    """Yield the shared subscribe callback mock, reset after the test."""
+    yield _subscribe_mock
+    _subscribe_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def unsubscribe_callback() -> Generator[AsyncMock, None, None]:
+    """Yield the shared unsubscribe callback mock, reset after the test."""
+    yield _unsubscribe_mock
+    _unsubscribe_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def complete_callback() -> Generator[AsyncMock, None, None]:
+    """Yield the shared completion callback mock, reset after the test."""
+    yield _complete_mock
+    _complete_mock.reset_mock(return_value=True, side_effect=True)
+
+
 @pytest.fixture
 def server_can_list_prompts(server: Server[object], prompt: types.Prompt) -> Server[object]:
     """Return a server instance with prompts."""
@@ -242,7 +304,6 @@ async def test_list_tools(
             await session.list_prompts()
 
 
-@pytest.mark.parametrize("logging_level_callback", [AsyncMock()])
 @pytest.mark.parametrize(
     "log_level",
     ["debug", "info", "notice", "warning", "error", "critical", "alert", "emergency"],
@@ -265,10 +326,8 @@ async def test_set_logging_error(
         logging_level_callback.return_value = None
         await session.set_logging_level(log_level)
         logging_level_callback.assert_called_once_with(log_level)
-        logging_level_callback.reset_mock()  # Reset the mock for the next test case
 
 
-@pytest.mark.parametrize("tool", [AsyncMock()])
 async def test_call_tool(
     session_generator: SessionContextManager,
     server_can_call_tool: Server[object],
@@ -290,7 +349,6 @@ async def test_call_tool(
         assert not call_tool_result.isError
 
         tool.assert_called_once_with("tool", {})
-        tool.reset_mock()
 
 
 @pytest.mark.parametrize(
@@ -354,7 +412,6 @@ async def test_list_resource_templates(
         assert list_resources_result.resourceTemplates == [resource_template]
 
 
-@pytest.mark.parametrize("prompt_callback", [AsyncMock()])
 @pytest.mark.parametrize("prompt", [types.Prompt(name="prompt1")])
 async def test_get_prompt(
     session_generator: SessionContextManager,
@@ -369,10 +426,8 @@ async def test_get_prompt(
 
         await session.get_prompt("prompt", {})
         prompt_callback.assert_called_once_with("prompt", {})
-        prompt_callback.reset_mock()
 
 
-@pytest.mark.parametrize("resource_callback", [AsyncMock()])
 @pytest.mark.parametrize(
     "resource",
     [
@@ -396,10 +451,8 @@ async def test_read_resource(
         resource_callback.return_value = "resource-content"
         await session.read_resource(resource.uri)
         resource_callback.assert_called_once_with(resource.uri)
-        resource_callback.reset_mock()
 
 
-@pytest.mark.parametrize("subscribe_callback", [AsyncMock()])
 @pytest.mark.parametrize(
     "resource",
     [
@@ -423,10 +476,8 @@ async def test_subscribe_resource(
         subscribe_callback.return_value = None
         await session.subscribe_resource(resource.uri)
         subscribe_callback.assert_called_once_with(resource.uri)
-        subscribe_callback.reset_mock()
 
 
-@pytest.mark.parametrize("unsubscribe_callback", [AsyncMock()])
 @pytest.mark.parametrize(
     "resource",
     [
@@ -450,7 +501,6 @@ async def test_unsubscribe_resource(
         unsubscribe_callback.return_value = None
         await session.unsubscribe_resource(resource.uri)
         unsubscribe_callback.assert_called_once_with(resource.uri)
-        unsubscribe_callback.reset_mock()
 
 
 async def test_send_progress_notification(
@@ -468,7 +518,6 @@ async def test_send_progress_notification(
         )
 
 
-@pytest.mark.parametrize("complete_callback", [AsyncMock()])
 async def test_complete(
     session_generator: SessionContextManager,
     server_can_complete: Server[object],
@@ -490,10 +539,8 @@ async def test_complete(
             types.PromptReference(type="ref/prompt", name="name"),
             types.CompletionArgument(name="name", value="value"),
         )
-        complete_callback.reset_mock()
 
 
-@pytest.mark.parametrize("tool", [AsyncMock()])
 async def test_call_tool_with_error(
     session_generator: SessionContextManager,
     server_can_call_tool: Server[object],